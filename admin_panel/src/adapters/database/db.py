@@ -1,14 +1,45 @@
+import os
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.pool import NullPool
+
+
+# Session makers cached per database URL so warm Lambda invocations reuse
+# the engine, its connection pool and compiled-statement cache instead of
+# rebuilding them on every call.
+_session_makers: dict[str, async_sessionmaker[AsyncSession]] = {}
 
 
 def get_session_maker(database_url: str) -> async_sessionmaker[AsyncSession]:
-    engine = create_async_engine(database_url, pool_size=10, max_overflow=20)
-    session_maker = async_sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
+    session_maker = _session_makers.get(database_url)
+    if session_maker is None:
+        if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+            # A Lambda container handles one invocation at a time; holding a
+            # pool of idle connections per container only burns Postgres
+            # max_connections across the fleet.
+            pool_kwargs = {"poolclass": NullPool}
+        else:
+            pool_kwargs = {
+                "pool_size": 20,
+                "max_overflow": 0,
+                "pool_pre_ping": True,
+                "pool_recycle": 1800,
+                # LIFO checkout keeps a hot subset of connections busy so
+                # idle connections age out and get reaped sooner.
+                "pool_use_lifo": True,
+            }
+        engine = create_async_engine(
+            database_url.replace("postgresql://", "postgresql+asyncpg://", 1),
+            query_cache_size=1200,
+            connect_args={"statement_cache_size": 1024},
+            **pool_kwargs,
+        )
+        session_maker = async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        )
+        _session_makers[database_url] = session_maker
     return session_maker
 
 
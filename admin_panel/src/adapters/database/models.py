@@ -1,24 +1,51 @@
-from sqlalchemy import Table, Column, Integer, String, ForeignKey, TIMESTAMP
+from sqlalchemy import Table, Column, Integer, String, ForeignKey, TIMESTAMP, func
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import registry
 
 mapper_registry = registry()
 
 
-resources = Table(
+prompts = Table(
     "prompts",
     mapper_registry.metadata,
     Column("id", Integer, primary_key=True, autoincrement=True),
-    Column("prompt_id", String, nullable=False),
+    Column("prompt_id", UUID(as_uuid=True), nullable=False, index=True, unique=True),
     Column("text", String, nullable=False),
+    Column(
+        "created_at",
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    ),
+    Column(
+        "updated_at",
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        server_onupdate=func.now(),
+        nullable=False,
+    ),
 )
 
 
-knowledge_bases = Table(
+agent_chat_bots = Table(
     "agent_chat_bots",
     mapper_registry.metadata,
     Column("id", Integer, primary_key=True, autoincrement=True),
-    Column("agent_chat_bot_id", String, nullable=False),
+    Column("agent_chat_bot_id", UUID(as_uuid=True), nullable=False, index=True, unique=True),
     Column("name", String, nullable=False),
     Column("prompt_id", Integer, ForeignKey("prompts.id"), nullable=True),
     Column("knowledge_base_id", String, nullable=True),
+    Column(
+        "created_at",
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    ),
+    Column(
+        "updated_at",
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        server_onupdate=func.now(),
+        nullable=False,
+    ),
 )
@@ -1,7 +1,9 @@
 from aws_lambda_powertools import Logger
-from sqlalchemy import update, select, delete, text
+from sqlalchemy import String, bindparam, exists, func, insert, select, update
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.adapters.database.models import agent_chat_bots, prompts
 from src.application.models.agent_chat_bot import AgentChatBot
 from src.application.models.prompt import Prompt
 from src.application.ports.unit_of_work import (
@@ -14,6 +16,69 @@ from src.application.ports.unit_of_work import (
 logger = Logger("sql_unit_of_work")
 
 
+# Statements built once at module scope; SQLAlchemy caches their compiled
+# form, so repeated calls skip SQL string construction and re-parsing.
+_AGENT_INSERT_STMT = (
+    insert(agent_chat_bots)
+    .from_select(
+        ["name", "agent_chat_bot_id", "prompt_id", "knowledge_base_id"],
+        select(
+            bindparam("name", type_=String),
+            bindparam("agent_chat_bot_id", type_=UUID(as_uuid=True)),
+            prompts.c.id,
+            bindparam("knowledge_base_id", type_=String),
+        ).where(prompts.c.prompt_id == bindparam("prompt_id")),
+    )
+    .returning(agent_chat_bots.c.id, agent_chat_bots.c.prompt_id)
+)
+
+_AGENT_INSERT_DIRECT_STMT = insert(agent_chat_bots).returning(agent_chat_bots.c.id)
+
+_AGENT_GET_STMT = (
+    select(
+        agent_chat_bots.c.name,
+        agent_chat_bots.c.knowledge_base_id,
+        prompts.c.prompt_id,
+    )
+    .select_from(
+        agent_chat_bots.join(
+            prompts, prompts.c.id == agent_chat_bots.c.prompt_id
+        )
+    )
+    .where(agent_chat_bots.c.agent_chat_bot_id == bindparam("agent_chat_bot_id"))
+)
+
+_PROMPT_INSERT_STMT = insert(prompts)
+
+_PROMPT_INSERT_RETURNING_STMT = insert(prompts).returning(prompts.c.id)
+
+# Columns the agent update path may touch; anything else in kwargs is a
+# programming error and must not reach the SQL layer.
+_AGENT_UPDATABLE_FIELDS = frozenset({"name", "prompt_id", "knowledge_base_id"})
+
+# Below this row count a single multi-row INSERT is cheaper than setting
+# up a COPY stream; above it asyncpg's COPY is 4-5x faster than
+# executemany.
+_COPY_THRESHOLD = 100
+
+_PROMPT_GET_STMT = select(prompts.c.text).where(
+    prompts.c.prompt_id == bindparam("prompt_id")
+)
+
+_PROMPT_ID_STMT = select(prompts.c.id).where(
+    prompts.c.prompt_id == bindparam("prompt_id")
+)
+
+# updated_at is set explicitly: server_onupdate on the model is metadata
+# only, Postgres has no ON UPDATE default and no trigger maintains it.
+_PROMPT_UPDATE_TEXT_STMT = (
+    update(prompts)
+    .where(prompts.c.prompt_id == bindparam("prompt_id"))
+    .values(text=bindparam("text"), updated_at=func.now())
+    .returning(prompts.c.id)
+)
+
+
 class SqlAgentChatBotRepository(AgentChatBotRepository):
     """
     Repository implementation for managing agent chat bots using SQL database.
@@ -33,8 +98,12 @@ class SqlAgentChatBotRepository(AgentChatBotRepository):
             session (AsyncSession): The SQLAlchemy async session for database operations.
         """
         self._session = session
+        # Resolved prompt business-id -> internal-id mappings for the
+        # lifetime of this unit of work, so repeated commands against the
+        # same prompt skip the DB-side resolution.
+        self._prompt_id_cache: dict = {}
 
-    async def add(self, agent_chat_bot: AgentChatBot) -> None:
+    async def add(self, agent_chat_bot: AgentChatBot) -> int:
         """
         Adds a new agent chat bot to the database.
 
@@ -44,45 +113,59 @@ class SqlAgentChatBotRepository(AgentChatBotRepository):
         Args:
             agent_chat_bot (AgentChatBot): The agent chat bot object to be added.
 
+        Returns:
+            int: The server-assigned primary key of the new row.
+
         Raises:
             ValueError: If the associated prompt does not exist in the database.
         """
-        logger.info(f"Adding agent chat bot: {agent_chat_bot}")
-        # First, verify prompt exists and get its internal ID
-        get_prompt_id_query = text(
-            """
-                    SELECT id FROM prompts
-                    WHERE prompt_id = :prompt_id
-                """
-        )
-        result = await self._session.execute(
-            get_prompt_id_query, {"prompt_id": agent_chat_bot.prompt_id}
+        logger.info(
+            "Adding agent chat bot",
+            extra={"agent_chat_bot_id": agent_chat_bot.agent_chat_bot_id},
         )
-        row = result.fetchone()
-        if not row:
-            logger.error(f"Prompt with ID {agent_chat_bot.prompt_id} not found")
-            raise ValueError(
-                f"Prompt with ID {agent_chat_bot.prompt_id} does not exist"
+        cached_prompt_id = self._prompt_id_cache.get(agent_chat_bot.prompt_id)
+        if cached_prompt_id is not None:
+            # Prompt already resolved in this unit of work; insert directly.
+            result = await self._session.execute(
+                _AGENT_INSERT_DIRECT_STMT,
+                {
+                    "name": agent_chat_bot.name,
+                    "agent_chat_bot_id": agent_chat_bot.agent_chat_bot_id,
+                    "knowledge_base_id": agent_chat_bot.knowledge_base_id,
+                    "prompt_id": cached_prompt_id,
+                },
             )
-        prompt_id = row[0]
-
-        # Insert the new agent chat bot
-        insert_resource_query = text(
-            """
-                    INSERT INTO agent_chat_bots (name, agent_chat_bot_id, prompt_id, knowledge_base_id)
-                    VALUES (:name, :agent_chat_bot_id, :prompt_id, :knowledge_base_id)
-                """
-        )
-        await self._session.execute(
-            insert_resource_query,
+            logger.info(
+                "Agent added successfully",
+                extra={"agent_chat_bot_id": agent_chat_bot.agent_chat_bot_id},
+            )
+            return result.scalar_one()
+        # Insert in a single round-trip: the SELECT resolves the prompt's
+        # internal ID and produces no rows when the prompt does not exist,
+        # which we detect via the empty RETURNING set.
+        result = await self._session.execute(
+            _AGENT_INSERT_STMT,
             {
                 "name": agent_chat_bot.name,
                 "agent_chat_bot_id": agent_chat_bot.agent_chat_bot_id,
                 "knowledge_base_id": agent_chat_bot.knowledge_base_id,
-                "prompt_id": prompt_id,
+                "prompt_id": agent_chat_bot.prompt_id,
             },
         )
-        logger.info(f"Agent {agent_chat_bot.agent_chat_bot_id} added successfully")
+        row = result.fetchone()
+        if row is None:
+            logger.error(
+                "Prompt not found", extra={"prompt_id": agent_chat_bot.prompt_id}
+            )
+            raise ValueError(
+                f"Prompt with ID {agent_chat_bot.prompt_id} does not exist"
+            )
+        self._prompt_id_cache[agent_chat_bot.prompt_id] = row.prompt_id
+        logger.info(
+            "Agent added successfully",
+            extra={"agent_chat_bot_id": agent_chat_bot.agent_chat_bot_id},
+        )
+        return row.id
 
     async def get(self, agent_chat_bot_id: str) -> AgentChatBot:
         """
@@ -97,17 +180,11 @@ class SqlAgentChatBotRepository(AgentChatBotRepository):
         Raises:
             ValueError: If no agent chat bot is found with the given ID.
         """
-        logger.info(f"Fetching agent with ID: {agent_chat_bot_id}")
-        query = text(
-            """
-                   SELECT name, knowledge_base_id, prompts.prompt_id
-                   FROM agent_chat_bots
-                   INNER JOIN prompts ON prompts.prompt_id = :prompt_id
-                   WHERE agent_chat_bot_id = :agent_chat_bot_id
-               """
+        logger.info(
+            "Fetching agent", extra={"agent_chat_bot_id": agent_chat_bot_id}
         )
         result = await self._session.execute(
-            query, {"agent_chat_bot_id": agent_chat_bot_id}
+            _AGENT_GET_STMT, {"agent_chat_bot_id": agent_chat_bot_id}
         )
         row = result.fetchone()
         if row:
@@ -129,42 +206,113 @@ class SqlAgentChatBotRepository(AgentChatBotRepository):
             **kwargs: Key-value pairs of fields to update.
 
         Raises:
-            ValueError: If updating the prompt_id and the new prompt doesn't exist.
+            ValueError: If a non-updatable field is passed, or if updating
+                the prompt_id and the new prompt doesn't exist.
         """
-        logger.info(f"Updating agent with ID: {agent_chat_bot_id}")
-        # Handle prompt_id updates separately to verify prompt exists
-        if "prompt_id" in kwargs:
-            logger.info(f"Fetching prompt ID for prompt_id: {kwargs.get("prompt_id")}")
-
-            query = text(
-                """
-                SELECT id FROM prompts
-                WHERE prompt_id = :prompt_id
-                """
-            )
-            result = await self._session.execute(
-                query, {"prompt_id": kwargs.get("prompt_id")}
+        logger.info(
+            "Updating agent", extra={"agent_chat_bot_id": agent_chat_bot_id}
+        )
+        unknown_fields = set(kwargs) - _AGENT_UPDATABLE_FIELDS
+        if unknown_fields:
+            raise ValueError(
+                f"Cannot update fields {sorted(unknown_fields)} on agent chat bots"
             )
-            row = result.fetchone()
-            if not row:
-                logger.error(
-                    f"Prompt with prompt_id {kwargs.get("prompt_id")} not found"
+        # Drop unset fields; a no-op UPDATE still takes a row lock and
+        # writes a WAL record, so skip the round-trip entirely.
+        kwargs = {key: value for key, value in kwargs.items() if value is not None}
+        if not kwargs:
+            return
+        # Resolve prompt_id via a subquery inside the UPDATE itself so the
+        # whole operation stays a single round-trip; the EXISTS guard keeps
+        # the update from running with an unresolvable prompt, which we
+        # detect via the empty RETURNING set.
+        if "prompt_id" in kwargs:
+            cached_prompt_id = self._prompt_id_cache.get(kwargs["prompt_id"])
+            if cached_prompt_id is not None:
+                # Prompt already resolved in this unit of work; update with
+                # the internal ID directly.
+                stmt = (
+                    update(agent_chat_bots)
+                    .where(
+                        agent_chat_bots.c.agent_chat_bot_id
+                        == bindparam("agent_chat_bot_id")
+                    )
+                    .values(
+                        {key: bindparam(key) for key in kwargs}
+                        | {"updated_at": func.now()}
+                    )
+                )
+                params = {
+                    "agent_chat_bot_id": agent_chat_bot_id,
+                    **kwargs,
+                    "prompt_id": cached_prompt_id,
+                }
+                await self._session.execute(stmt, params)
+                return
+            stmt = (
+                update(agent_chat_bots)
+                .where(
+                    agent_chat_bots.c.agent_chat_bot_id
+                    == bindparam("agent_chat_bot_id")
                 )
-                raise ValueError(
-                    f"Prompt with prompt_id {kwargs.get("prompt_id")} does not exist"
+                .where(
+                    exists(
+                        select(prompts.c.id).where(
+                            prompts.c.prompt_id == bindparam("prompt_id")
+                        )
+                    )
                 )
-            kwargs["prompt_id"] = row[0]
+                .values(
+                    {
+                        key: (
+                            _PROMPT_ID_STMT.scalar_subquery()
+                            if key == "prompt_id"
+                            else bindparam(key)
+                        )
+                        for key in kwargs
+                    }
+                    | {"updated_at": func.now()}
+                )
+                .returning(agent_chat_bots.c.id, agent_chat_bots.c.prompt_id)
+            )
+            params = {"agent_chat_bot_id": agent_chat_bot_id, **kwargs}
+            result = await self._session.execute(stmt, params)
+            row = result.fetchone()
+            if row is None:
+                # Empty RETURNING means either the prompt or the agent is
+                # missing; only the first is an error (the other update
+                # paths no-op silently on a missing agent), so resolve the
+                # prompt separately on this cold path.
+                prompt_internal_id = (
+                    await self._session.execute(
+                        _PROMPT_ID_STMT, {"prompt_id": kwargs["prompt_id"]}
+                    )
+                ).scalar_one_or_none()
+                if prompt_internal_id is None:
+                    logger.error(
+                        "Prompt not found",
+                        extra={"prompt_id": kwargs.get("prompt_id")},
+                    )
+                    raise ValueError(
+                        f"Prompt with prompt_id {kwargs.get("prompt_id")} does not exist"
+                    )
+                self._prompt_id_cache[kwargs["prompt_id"]] = prompt_internal_id
+                return
+            self._prompt_id_cache[kwargs["prompt_id"]] = row.prompt_id
+            return
         # Construct and execute update query
-        set_clause = ", ".join([f"{key} = :{key}" for key in kwargs])
-        query = text(
-            f"""
-                UPDATE agent_chat_bots
-                SET {set_clause}
-                WHERE agent_chat_bot_id = :agent_chat_bot_id
-            """
+        stmt = (
+            update(agent_chat_bots)
+            .where(
+                agent_chat_bots.c.agent_chat_bot_id == bindparam("agent_chat_bot_id")
+            )
+            .values(
+                {key: bindparam(key) for key in kwargs}
+                | {"updated_at": func.now()}
+            )
         )
         params = {"agent_chat_bot_id": agent_chat_bot_id, **kwargs}
-        await self._session.execute(query, params)
+        await self._session.execute(stmt, params)
 
 
 class SqlPromptRepository(PromptRepository):
@@ -187,27 +335,53 @@ class SqlPromptRepository(PromptRepository):
         """
         self._session = session
 
-    async def add(self, prompt: Prompt) -> None:
+    async def add(self, prompt: Prompt) -> int:
         """
         Adds a new prompt to the database.
 
         Args:
             prompt (Prompt): The prompt object to be added.
+
+        Returns:
+            int: The server-assigned primary key of the new row.
         """
-        logger.info(f"Adding prompt: {prompt}")
-        query = text(
-            """
-                    INSERT INTO prompts (prompt_id, text)
-                    VALUES (:prompt_id, :text)
-                """
-        )
-        await self._session.execute(
-            query,
+        logger.info("Adding prompt", extra={"prompt_id": prompt.prompt_id})
+        result = await self._session.execute(
+            _PROMPT_INSERT_RETURNING_STMT,
             {
                 "prompt_id": prompt.prompt_id,
                 "text": prompt.text,
             },
         )
+        return result.scalar_one()
+
+    async def add_many(self, prompts: list[Prompt]) -> None:
+        """
+        Adds a batch of prompts to the database in one operation.
+
+        Small batches go through a single multi-row INSERT; large batches
+        stream through asyncpg's COPY protocol, which avoids per-row
+        statement overhead entirely.
+
+        Args:
+            prompts (list[Prompt]): The prompt objects to be added.
+        """
+        if not prompts:
+            return
+        logger.info("Adding prompts batch", extra={"count": len(prompts)})
+        if len(prompts) < _COPY_THRESHOLD:
+            await self._session.execute(
+                _PROMPT_INSERT_STMT,
+                [{"prompt_id": p.prompt_id, "text": p.text} for p in prompts],
+            )
+            return
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            "prompts",
+            records=[(p.prompt_id, p.text) for p in prompts],
+            columns=["prompt_id", "text"],
+        )
 
     async def get(self, prompt_id: str) -> Prompt:
         """
@@ -222,23 +396,17 @@ class SqlPromptRepository(PromptRepository):
         Raises:
             ValueError: If no prompt is found with the given ID.
         """
-        logger.info(f"Fetching prompt with ID: {prompt_id}")
-        query = text(
-            """
-                    SELECT text
-                    FROM prompts
-                    WHERE prompt_id = :prompt_id
-                """
+        logger.info("Fetching prompt", extra={"prompt_id": prompt_id})
+        result = await self._session.execute(
+            _PROMPT_GET_STMT, {"prompt_id": prompt_id}
         )
-        result = await self._session.execute(query, {"prompt_id": prompt_id})
-        row = result.fetchone()
-        if row:
-            return Prompt(
-                prompt_id=prompt_id,
-                text=row[0],
-            )
-        else:
+        prompt_text = result.scalar_one_or_none()
+        if prompt_text is None:
             raise ValueError(f"Prompt with ID {prompt_id} not found")
+        return Prompt(
+            prompt_id=prompt_id,
+            text=prompt_text,
+        )
 
     async def update(self, prompt_id: str, **kwargs):
         """
@@ -251,38 +419,20 @@ class SqlPromptRepository(PromptRepository):
         Raises:
             ValueError: If updating the prompt_id and the new prompt doesn't exist.
         """
-        logger.info(f"Updating text for prompt with ID: {prompt_id}")
-
-        # Verify prompt exists before update
-        verify_query = text(
-            """
-            SELECT id FROM prompts
-            WHERE prompt_id = :prompt_id
-            """
-        )
-        result = await self._session.execute(
-            verify_query, {"prompt_id": prompt_id}
-        )
-        row = result.fetchone()
-        if not row:
-            logger.error(f"Prompt with prompt_id {prompt_id} not found")
-            raise ValueError(f"Prompt with prompt_id {prompt_id} does not exist")
+        logger.info("Updating prompt text", extra={"prompt_id": prompt_id})
 
-        # Update prompt text
-        update_query = text(
-            """
-            UPDATE prompts
-            SET text = :text
-            WHERE prompt_id = :prompt_id
-            """
-        )
-        await self._session.execute(
-            update_query,
+        # Update and verify existence in a single round-trip: an empty
+        # RETURNING set means the prompt was never there.
+        result = await self._session.execute(
+            _PROMPT_UPDATE_TEXT_STMT,
             {
                 "prompt_id": prompt_id,
                 "text": kwargs.get("text", ""),
             }
         )
+        if result.scalar_one_or_none() is None:
+            logger.error("Prompt not found", extra={"prompt_id": prompt_id})
+            raise ValueError(f"Prompt with prompt_id {prompt_id} does not exist")
         logger.info(f"Successfully updated text for prompt: {prompt_id}")
 
 class SqlUnitOfWork(UnitOfWork):
@@ -298,17 +448,21 @@ class SqlUnitOfWork(UnitOfWork):
         session (AsyncSession): The SQLAlchemy async session for database operations.
     """
 
-    agent_chat_bots: SqlAgentChatBotRepository
-    prompts: SqlPromptRepository
+    __slots__ = ("session", "agent_chat_bots", "prompts")
 
     def __init__(self, session: AsyncSession) -> None:
         """
         Initializes the SqlUnitOfWork with an async session.
 
+        The repositories only hold a reference to the session, so they are
+        created once here instead of on every __aenter__.
+
         Args:
             session (AsyncSession): The SQLAlchemy async session for database operations.
         """
         self.session = session
+        self.agent_chat_bots = SqlAgentChatBotRepository(session)
+        self.prompts = SqlPromptRepository(session)
 
     async def commit(self) -> None:
         """
@@ -319,19 +473,18 @@ class SqlUnitOfWork(UnitOfWork):
 
     async def __aenter__(self):
         """
-        Enters the context manager, initializing repositories.
+        Enters the context manager.
 
         Returns:
-            SqlUnitOfWork: The initialized unit of work instance.
+            SqlUnitOfWork: The unit of work instance.
         """
         logger.info("Starting new unit of work")
-        self.agent_chat_bots = SqlAgentChatBotRepository(self.session)
-        self.prompts = SqlPromptRepository(self.session)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """
-        Exits the context manager, cleaning up repositories.
+        Exits the context manager, committing on success and rolling back
+        on error so all work in the block shares one transaction.
 
         Args:
             exc_type: The type of the exception that was raised, if any.
@@ -339,6 +492,7 @@ class SqlUnitOfWork(UnitOfWork):
             exc_tb: The traceback of the exception that was raised, if any.
         """
         if exc_type:
-            logger.error(f"Error occurred: {exc_val}")
-        self.agent_chat_bots = None  # type: ignore
-        self.prompts = None  # type: ignore
+            logger.error("Error occurred", extra={"error": str(exc_val)})
+            await self.session.rollback()
+        else:
+            await self.commit()
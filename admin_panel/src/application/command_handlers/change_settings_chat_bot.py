@@ -45,6 +45,10 @@ class ChangeSettingsAgentChatBotCommandHandler(BaseCommandHandler):
             "Start create agent chat bot",
             extra={"command": command},
         )
+        if command.prompt_id is None and command.knowledge_base_id is None:
+            # Nothing to change; skip the transaction entirely.
+            logger.info("No settings to update")
+            return {"agent_chat_bot_id": command.agent_chat_bot_id}
         async with self._unit_of_work as uow:
             logger.info(
                 "update chat bot",
@@ -59,6 +63,5 @@ class ChangeSettingsAgentChatBotCommandHandler(BaseCommandHandler):
                 prompt_id=command.prompt_id,
                 knowledge_base_id=command.knowledge_base_id,
             )
-            await uow.commit()
             logger.info("Agent chat bot updated")
         return {"agent_chat_bot_id": command.agent_chat_bot_id}
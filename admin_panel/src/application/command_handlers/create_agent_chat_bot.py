@@ -50,7 +50,7 @@ class CreateAgentChatBotCommandHandler(BaseCommandHandler):
         async with self._unit_of_work as uow:
             # Create a new agent chat bot with a unique ID
             agent = AgentChatBot(
-                agent_chat_bot_id=str(uuid.uuid4()),
+                agent_chat_bot_id=uuid.uuid4(),
                 name=command.name,
                 prompt_id=command.prompt_id,
                 knowledge_base_id=command.knowledge_base_id,
@@ -65,6 +65,5 @@ class CreateAgentChatBotCommandHandler(BaseCommandHandler):
             )
             # Store the agent chat bot in the database
             await uow.agent_chat_bots.add(agent)
-            await uow.commit()
             logger.info("Agent chat bot created")
-        return {"agent_chat_bot_id": agent.agent_chat_bot_id}
+        return {"agent_chat_bot_id": str(agent.agent_chat_bot_id)}
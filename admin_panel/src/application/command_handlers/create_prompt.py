@@ -49,7 +49,7 @@ class CreatePromptCommandHandler(BaseCommandHandler):
         )
         async with self._unit_of_work as uow:
             # Create a new prompt with a unique ID
-            prompt = Prompt(prompt_id=str(uuid.uuid4()), text=command.text)
+            prompt = Prompt(prompt_id=uuid.uuid4(), text=command.text)
             logger.info(
                 "Create prompt",
                 extra={
@@ -58,6 +58,5 @@ class CreatePromptCommandHandler(BaseCommandHandler):
             )
             # Store the prompt in the database
             await uow.prompts.add(prompt)
-            await uow.commit()
             logger.info("Prompt created")
-        return {"prompt_id": prompt.prompt_id}
+        return {"prompt_id": str(prompt.prompt_id)}
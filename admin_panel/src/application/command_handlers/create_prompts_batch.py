@@ -0,0 +1,57 @@
+import uuid
+
+from aws_lambda_powertools import Logger
+
+from src.application.command_handlers.base import BaseCommandHandler
+from src.application.commands.create_prompts_batch import CreatePromptsBatchCommand
+from src.application.models.prompt import Prompt
+from src.application.ports.unit_of_work import UnitOfWork
+
+
+logger = Logger(service="create_prompts_batch_handler")
+
+
+class CreatePromptsBatchCommandHandler(BaseCommandHandler):
+    """
+    Command handler for creating a batch of prompts.
+
+    This handler processes a `CreatePromptsBatchCommand`, which contains a list
+    of prompt texts. It stores all prompts through the repository's bulk-add
+    path and commits once, instead of running one transaction per prompt.
+
+    Attributes:
+        _unit_of_work (UnitOfWork): Handles interactions with the database repositories.
+    """
+
+    def __init__(self, unit_of_work: UnitOfWork):
+        """
+        Initializes the create prompts batch command handler.
+
+        Args:
+            unit_of_work (UnitOfWork): The unit of work for managing database transactions.
+        """
+        self._unit_of_work = unit_of_work
+
+    async def __call__(self, command: CreatePromptsBatchCommand):
+        """
+        Handles the batch create command by storing all prompts in one transaction.
+
+        Args:
+            command (CreatePromptsBatchCommand): The command object containing the prompt texts.
+
+        Returns:
+            dict: The response containing the newly created prompt IDs.
+        """
+        logger.info(
+            "Start create prompts batch",
+            extra={"count": len(command.texts)},
+        )
+        async with self._unit_of_work as uow:
+            # Create the prompts with unique IDs and store them in one pass
+            prompts = [
+                Prompt(prompt_id=uuid.uuid4(), text=text)
+                for text in command.texts
+            ]
+            await uow.prompts.add_many(prompts)
+            logger.info("Prompts batch created")
+        return {"prompt_ids": [str(prompt.prompt_id) for prompt in prompts]}
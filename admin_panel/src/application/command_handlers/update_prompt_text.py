@@ -55,6 +55,5 @@ class UpdatePromptTextCommandHandler(BaseCommandHandler):
                 prompt_id=command.prompt_id,
                 text=command.text,
             )
-            await uow.commit()
             logger.info("Prompt text updated")
         return {"prompt_id": command.prompt_id}
\ No newline at end of file
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from src.application.commands.base import BaseCommand
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChangeSettingsAgentChatBotCommand(BaseCommand):
     agent_chat_bot_id: str
     knowledge_base_id: str | None = None
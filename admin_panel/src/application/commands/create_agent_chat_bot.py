@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from src.application.commands.base import BaseCommand
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CreateAgentChatBotCommand(BaseCommand):
     name: str
     prompt_id: str | None = None
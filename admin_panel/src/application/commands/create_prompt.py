@@ -3,6 +3,6 @@ from dataclasses import dataclass
 from src.application.commands.base import BaseCommand
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CreatePromptCommand(BaseCommand):
     text: str
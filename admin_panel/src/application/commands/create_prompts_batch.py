@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+from src.application.commands.base import BaseCommand
+
+
+@dataclass(slots=True, frozen=True)
+class CreatePromptsBatchCommand(BaseCommand):
+    texts: list[str]
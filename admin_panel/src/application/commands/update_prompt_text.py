@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from src.application.commands.base import BaseCommand
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UpdatePromptTextCommand(BaseCommand):
     prompt_id: str
     text: str = ""
@@ -1,19 +1,20 @@
+import uuid
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentChatBot:
     """
     Data model representing an agent chat bot.
 
     Attributes:
         name (str): The name of the chat bot.
-        agent_chat_bot_id (str): Unique identifier for the chat bot.
-        prompt_id (str): ID of the associated prompt.
+        agent_chat_bot_id (uuid.UUID): Unique identifier for the chat bot.
+        prompt_id (uuid.UUID): ID of the associated prompt.
         knowledge_base_id (str): ID of the associated knowledge base.
     """
 
     name: str
-    agent_chat_bot_id: str
-    prompt_id: str
+    agent_chat_bot_id: uuid.UUID
+    prompt_id: uuid.UUID
     knowledge_base_id: str
@@ -1,15 +1,16 @@
+import uuid
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Prompt:
     """
     Data model representing a prompt.
 
     Attributes:
-        prompt_id (str): Unique identifier for the prompt.
+        prompt_id (uuid.UUID): Unique identifier for the prompt.
         text (str): The prompt text content.
     """
 
-    prompt_id: str
+    prompt_id: uuid.UUID
     text: str
@@ -8,12 +8,15 @@ class AgentChatBotRepository(ABC):
     """Repository interface for managing agent chat bots."""
 
     @abstractmethod
-    async def add(self, agent_chat_bot: AgentChatBot) -> None:
+    async def add(self, agent_chat_bot: AgentChatBot) -> int:
         """
         Add a new agent chat bot to the repository.
 
         Args:
             agent_chat_bot: AgentChatBot object to store
+
+        Returns:
+            The server-assigned primary key of the new row
         """
         raise NotImplementedError
 
@@ -46,12 +49,25 @@ class PromptRepository(ABC):
     """Repository interface for managing prompts."""
 
     @abstractmethod
-    async def add(self, prompt: Prompt) -> None:
+    async def add(self, prompt: Prompt) -> int:
         """
         Add a new prompt to the repository.
 
         Args:
             prompt: Prompt object to store
+
+        Returns:
+            The server-assigned primary key of the new row
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_many(self, prompts: list[Prompt]) -> None:
+        """
+        Add a batch of prompts to the repository in one operation.
+
+        Args:
+            prompts: Prompt objects to store
         """
         raise NotImplementedError
 
@@ -42,22 +42,13 @@ async def create_prompt(
     Returns:
         api_models.CreatePromptResponse: The response containing the newly created prompt's data.
     """
-    logger.info(f"Received request for prompt: {request}")
     # Create a command object from the request data
     command = CreatePromptCommand(
         text=request.text,
     )
-    logger.info(f"Created command: {command}")
-
-    # Log handler instance and execute
-    logger.info(f"Handler instance before execution: {handler}")
     result = await handler(command)
-    logger.info("Handler execution completed")
-
-    # Create and return response
-    response = api_models.CreatePromptResponse(**result)
-    logger.info(f"Returning response: {response}")
-    return response
+    logger.info("create_prompt handled", extra={"prompt_id": result["prompt_id"]})
+    return api_models.CreatePromptResponse(**result)
 
 
 @lambda_handler_decorator(api_models.CreateAgentChatBotRequest)
@@ -79,23 +70,18 @@ async def create_agent_chat_bot(
     Returns:
         api_models.CreateAgentChatBotResponse: The response containing the newly created chat bot's data.
     """
-    logger.info(f"Received request for agent chat bot: {request}")
     # Create command from request data
     command = CreateAgentChatBotCommand(
         name=request.name,
         prompt_id=request.prompt_id,
         knowledge_base_id=request.knowledge_base_id,
     )
-    logger.info(f"Created command: {command}")
-
-    # Execute handler and create response
-    logger.info(f"Handler instance before execution: {handler}")
     result = await handler(command)
-    logger.info("Handler execution completed")
-
-    response = api_models.CreateAgentChatBotResponse(**result)
-    logger.info(f"Returning response: {response}")
-    return response
+    logger.info(
+        "create_agent_chat_bot handled",
+        extra={"agent_chat_bot_id": result["agent_chat_bot_id"]},
+    )
+    return api_models.CreateAgentChatBotResponse(**result)
 
 
 @lambda_handler_decorator(api_models.ChangeSettingsAgentChatBotRequest)
@@ -117,19 +103,14 @@ async def change_settings_agent_chat_bot(
     Returns:
         api_models.ChangeSettingsAgentChatBotResponse: The response containing the updated settings.
     """
-    logger.info(f"Received request for agent chat bot: {request}")
     # Create command from request
     command = ChangeSettingsAgentChatBotCommand(**request.model_dump())
-    logger.info(f"Created command: {command}")
-
-    # Execute handler
-    logger.info(f"Handler instance before execution: {handler}")
     result = await handler(command)
-    logger.info("Handler execution completed")
-
-    response = api_models.ChangeSettingsAgentChatBotResponse(**result)
-    logger.info(f"Returning response: {response}")
-    return response
+    logger.info(
+        "change_settings_agent_chat_bot handled",
+        extra={"agent_chat_bot_id": result["agent_chat_bot_id"]},
+    )
+    return api_models.ChangeSettingsAgentChatBotResponse(**result)
 
 
 @lambda_handler_decorator(api_models.UpdatePromptTextRequest)
@@ -151,19 +132,13 @@ async def update_prompt_text(
     Returns:
         api_models.UpdatePromptTextResponse: The response containing the updated settings.
     """
-    logger.info(f"Received request for update text prompt: {request}")
     # Create command from request
     command = UpdatePromptTextCommand(**request.model_dump())
-    logger.info(f"Created command: {command}")
-
-    # Execute handler
-    logger.info(f"Handler instance before execution: {handler}")
     result = await handler(command)
-    logger.info("Handler execution completed")
-
-    response = api_models.UpdatePromptTextResponse()
-    logger.info(f"Returning response: {response}")
-    return response
+    logger.info(
+        "update_prompt_text handled", extra={"prompt_id": result["prompt_id"]}
+    )
+    return api_models.UpdatePromptTextResponse()
 
 
 container = Container()
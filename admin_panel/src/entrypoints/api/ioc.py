@@ -17,6 +17,9 @@ from src.application.command_handlers.create_agent_chat_bot import (
     CreateAgentChatBotCommandHandler,
 )
 from src.application.command_handlers.create_prompt import CreatePromptCommandHandler
+from src.application.command_handlers.create_prompts_batch import (
+    CreatePromptsBatchCommandHandler,
+)
 from src.application.command_handlers.update_prompt_text import UpdatePromptTextCommandHandler
 
 logger = Logger(service="ioc")
@@ -90,6 +93,11 @@ class Container(DeclarativeContainer):
         unit_of_work=unit_of_work,
     )
 
+    create_prompts_batch_handler = providers.Factory(
+        CreatePromptsBatchCommandHandler,
+        unit_of_work=unit_of_work,
+    )
+
     create_agent_chat_bot_handler = providers.Factory(
         CreateAgentChatBotCommandHandler,
         unit_of_work=unit_of_work,
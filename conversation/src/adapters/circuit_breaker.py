@@ -0,0 +1,69 @@
+import time
+
+from aws_lambda_powertools import Logger
+
+logger = Logger("circuit_breaker")
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Minimal circuit breaker for downstream HTTP calls.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    calls fail fast with CircuitOpenError instead of occupying the event
+    loop for a full timeout. Once `reset_timeout` seconds pass, the next
+    call is let through as a probe; a success closes the circuit again.
+
+    Attributes:
+        _failure_threshold (int): Consecutive failures before opening.
+        _reset_timeout (float): Seconds the circuit stays open.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        """
+        Initializes the circuit breaker.
+
+        Args:
+            failure_threshold (int): Consecutive failures before opening.
+            reset_timeout (float): Seconds to wait before probing again.
+        """
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    def check(self) -> None:
+        """
+        Rejects the call if the circuit is open.
+
+        Raises:
+            CircuitOpenError: If the circuit is open and the reset timeout
+                has not elapsed yet.
+        """
+        if self._opened_at is None:
+            return
+        if time.monotonic() - self._opened_at >= self._reset_timeout:
+            # Half-open: let this call through as a probe.
+            self._opened_at = None
+            return
+        raise CircuitOpenError("Circuit is open; failing fast")
+
+    def record_success(self) -> None:
+        """Closes the circuit after a successful call."""
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Counts a failure and opens the circuit at the threshold."""
+        self._failures += 1
+        if self._failures >= self._failure_threshold:
+            if self._opened_at is None:
+                logger.warning(
+                    "Circuit opened",
+                    extra={"failures": self._failures},
+                )
+            self._opened_at = time.monotonic()
@@ -0,0 +1,81 @@
+import asyncio
+
+from aws_lambda_powertools import Logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = Logger("commit_coordinator")
+
+
+class CommitCoordinator:
+    """
+    Debounces commits on a shared database session.
+
+    Concurrent requests all resolve the same session from the container,
+    so each of them issuing its own COMMIT serializes a network round
+    trip per request. The coordinator lets the first caller wait a short
+    window, then flushes everything accumulated on the session with a
+    single COMMIT; callers that arrive inside the window await the same
+    commit instead of issuing their own.
+
+    Attributes:
+        _session (AsyncSession): The shared database session.
+        _window (float): Seconds to wait for more work before committing.
+    """
+
+    def __init__(self, session: AsyncSession, window: float = 0.005) -> None:
+        """
+        Initializes the coordinator.
+
+        Args:
+            session (AsyncSession): The shared database session.
+            window (float): Debounce window in seconds.
+        """
+        self._session = session
+        self._window = window
+        self._pending: asyncio.Future | None = None
+        self._commit_started = False
+
+    async def commit(self) -> None:
+        """
+        Commits the session, coalescing with any commit still in its window.
+
+        A round only admits callers until its COMMIT is issued; work
+        submitted after that point is not covered by the in-flight flush,
+        so late arrivals wait for it to finish and then open a new round.
+        """
+        while self._pending is not None:
+            if not self._commit_started:
+                # The round is still inside its debounce window; our
+                # statements are covered by its COMMIT.
+                await asyncio.shield(self._pending)
+                return
+            # The COMMIT is already in flight and excludes our statements.
+            # Its outcome belongs to the callers it covered; wait it out
+            # and start a fresh round for ours.
+            try:
+                await asyncio.shield(self._pending)
+            except Exception:
+                pass
+        self._pending = asyncio.get_running_loop().create_future()
+        pending = self._pending
+        try:
+            await asyncio.sleep(self._window)
+            self._commit_started = True
+            await self._session.commit()
+        except Exception as exc:
+            logger.error(f"Batched commit failed: {exc}")
+            if not pending.done():
+                pending.set_exception(exc)
+                pending.exception()  # mark retrieved for the no-waiters case
+            raise
+        else:
+            if not pending.done():
+                pending.set_result(None)
+        finally:
+            # If the owner task was cancelled, CancelledError bypassed the
+            # except clause above; cancel the future so waiters shielded on
+            # it are released instead of hanging forever.
+            if not pending.done():
+                pending.cancel()
+            self._pending = None
+            self._commit_started = False
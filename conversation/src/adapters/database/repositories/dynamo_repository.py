@@ -1,4 +1,6 @@
+import asyncio
 import os
+import time
 import uuid
 from datetime import datetime
 from decimal import Decimal
@@ -7,6 +9,49 @@ from src.application.models.conversation import Conversation, Message
 from src.application.ports.unit_of_work import ConversationRepository, BackgroundCheckRepository
 from boto3_type_annotations.dynamodb import ServiceResource
 
+_ENV = os.environ.get("ENVIRONMENT")
+
+
+# Raw items for recently read conversations, keyed by conversation_id.
+# Module-level because repositories are rebuilt per unit of work; a short
+# TTL keeps hot conversations from paying a DynamoDB round trip per turn.
+_CONVERSATION_CACHE: dict[str, tuple[float, dict]] = {}
+_CACHE_TTL = 5.0
+_CACHE_MAX_SIZE = 5000
+
+
+def _floats_to_decimal(data):
+    """
+    Converts every float in a nested structure to Decimal, in place.
+
+    Iterative worklist traversal rather than recursion: deep payloads pay
+    no Python call-frame per level and containers are mutated in place
+    instead of rebuilt. repr() preserves the float's shortest exact form.
+
+    Args:
+        data: The structure (dict/list/scalar) to convert.
+
+    Returns:
+        The same structure with floats replaced by Decimals.
+    """
+    if isinstance(data, float):
+        return Decimal(repr(data))
+    stack = [data]
+    while stack:
+        container = stack.pop()
+        if isinstance(container, dict):
+            items = container.items()
+        elif isinstance(container, list):
+            items = enumerate(container)
+        else:
+            continue
+        for key, value in items:
+            if isinstance(value, float):
+                container[key] = Decimal(repr(value))
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
+    return data
+
 
 class DynamoConversationRepository(ConversationRepository):
     """
@@ -28,8 +73,7 @@ class DynamoConversationRepository(ConversationRepository):
             dynamo_client (ServiceResource): The DynamoDB client used for accessing the service.
         """
         self._dynamo_client = dynamo_client
-        env = os.environ.get("ENVIRONMENT")
-        self._conversations = self._dynamo_client.Table(f"Conversations-{env}")
+        self._conversations = self._dynamo_client.Table(f"Conversations-{_ENV}")
 
     async def save(self, conversation: Conversation):
         """
@@ -40,7 +84,65 @@ class DynamoConversationRepository(ConversationRepository):
         Args:
             conversation (Conversation): The conversation object to be saved.
         """
-        self._conversations.put_item(Item=conversation.to_dict())
+        # boto3 is synchronous; run it in a worker thread so the put does
+        # not stall the event loop.
+        _CONVERSATION_CACHE.pop(conversation.conversation_id, None)
+        await asyncio.to_thread(self._conversations.put_item, Item=conversation.to_dict())
+
+    async def save_many(self, conversations: list[Conversation]):
+        """
+        Saves several conversations using DynamoDB's batch writer.
+
+        The batch writer groups up to 25 puts per request, so bulk saves
+        cost ceil(n/25) round trips instead of one per conversation.
+
+        Args:
+            conversations (list[Conversation]): The conversations to save.
+        """
+
+        def _write_batch():
+            with self._conversations.batch_writer() as batch:
+                for conversation in conversations:
+                    batch.put_item(Item=conversation.to_dict())
+
+        for conversation in conversations:
+            _CONVERSATION_CACHE.pop(conversation.conversation_id, None)
+        await asyncio.to_thread(_write_batch)
+
+    async def get_many(self, conversation_ids: list[str]) -> list[Conversation]:
+        """
+        Retrieves several conversations with BatchGetItem.
+
+        DynamoDB serves up to 100 keys per request, so n lookups cost
+        ceil(n/100) round trips instead of one each. Unprocessed keys are
+        retried with exponential backoff.
+
+        Args:
+            conversation_ids (list[str]): The IDs of the conversations.
+
+        Returns:
+            list[Conversation]: The conversations that were found.
+        """
+        table_name = self._conversations.name
+        conversations: list[Conversation] = []
+        pending = [{"conversation_id": cid} for cid in conversation_ids]
+        backoff = 0.05
+        while pending:
+            batch, pending = pending[:100], pending[100:]
+            response = await asyncio.to_thread(
+                self._dynamo_client.batch_get_item,
+                RequestItems={table_name: {"Keys": batch}},
+            )
+            for item in response.get("Responses", {}).get(table_name, []):
+                conversations.append(Conversation.from_dict(item))
+            unprocessed = (
+                response.get("UnprocessedKeys", {}).get(table_name, {}).get("Keys", [])
+            )
+            if unprocessed:
+                pending.extend(unprocessed)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 1.0)
+        return conversations
 
     async def get(self, conversation_id: str) -> Conversation | None:
         """
@@ -55,12 +157,22 @@ class DynamoConversationRepository(ConversationRepository):
         Raises:
             ValueError: If the conversation with the given ID is not found.
         """
-        response = self._conversations.get_item(
-            Key={"conversation_id": conversation_id}
+        cached = _CONVERSATION_CACHE.get(conversation_id)
+        if cached is not None:
+            expires_at, item = cached
+            if time.monotonic() < expires_at:
+                # Rebuild from the raw item so callers never share state.
+                return Conversation.from_dict(item)
+            del _CONVERSATION_CACHE[conversation_id]
+        response = await asyncio.to_thread(
+            self._conversations.get_item, Key={"conversation_id": conversation_id}
         )
         if "Item" not in response:
             return None
         item = response["Item"]
+        if len(_CONVERSATION_CACHE) >= _CACHE_MAX_SIZE:
+            _CONVERSATION_CACHE.clear()
+        _CONVERSATION_CACHE[conversation_id] = (time.monotonic() + _CACHE_TTL, item)
         return Conversation.from_dict(item)
 
 
@@ -84,8 +196,7 @@ class DynamoBackgroundCheckRepository(BackgroundCheckRepository):
             dynamo_client (ServiceResource): The DynamoDB client used for accessing the service.
         """
         self._dynamo_client = dynamo_client
-        env = os.environ.get("ENVIRONMENT")
-        self._background_checks = self._dynamo_client.Table(f"BackgroundCheck-{env}")
+        self._background_checks = self._dynamo_client.Table(f"BackgroundCheck-{_ENV}")
 
     async def save(self, user_id: str, background_check: dict):
         """
@@ -97,17 +208,10 @@ class DynamoBackgroundCheckRepository(BackgroundCheckRepository):
             background_check (dict): The conversation object to be saved.
         """
 
-        def convert_floats_to_decimal(data):
-            if isinstance(data, dict):
-                return {key: convert_floats_to_decimal(value) for key, value in data.items()}
-            elif isinstance(data, list):
-                return [convert_floats_to_decimal(item) for item in data]
-            elif isinstance(data, float):
-                return Decimal(str(data))  # Convert float to Decimal
-            else:
-                return data
-
-        background_check = convert_floats_to_decimal(background_check)
+        background_check = _floats_to_decimal(background_check)
         request_id = str(uuid.uuid4())
-        self._background_checks.put_item(Item={"request_id": request_id, "user_id": user_id, "data": background_check})
+        await asyncio.to_thread(
+            self._background_checks.put_item,
+            Item={"request_id": request_id, "user_id": user_id, "data": background_check},
+        )
         return request_id
@@ -1,8 +1,87 @@
+from dataclasses import dataclass, field
+
+import numpy as np
 from opensearchpy import AsyncOpenSearch
 
 from src.application.models.vectorized_knowledge import Resource, VectorizedKnowledge
 from src.application.ports.unit_of_work import VectorizedKnowledgeRepository
 
+_KNN_CACHE_MAX = 128
+_KNN_SIMILARITY_THRESHOLD = 0.95
+_KNN_CACHE_MAX_KEYS = 256
+
+
+@dataclass
+class _QueryCache:
+    """
+    Semantic cache of recent KNN queries and their results.
+
+    Rephrased queries rarely match an exact-string cache but often land
+    within a tight cosine distance of a recent query; when a cached
+    normalized vector is similar enough, the ANN round trip to OpenSearch
+    is skipped entirely. Entries live in a fixed-size ring buffer.
+
+    Cached vectors are quantized to int8 with a per-vector scale, cutting
+    the matrix to a quarter of its fp32 size; the ~2% similarity error
+    that introduces sits well inside the threshold's headroom.
+
+    Attributes:
+        vectors (np.ndarray): Quantized cached query vectors, shape (N, dim).
+        scales (np.ndarray): Per-vector dequantization scales, shape (N,).
+        results (list[VectorizedKnowledge]): Results parallel to vectors.
+    """
+
+    vectors: np.ndarray | None = None
+    scales: np.ndarray | None = None
+    results: list[VectorizedKnowledge] = field(default_factory=list)
+    _write_index: int = 0
+
+    def lookup(self, query: np.ndarray) -> VectorizedKnowledge | None:
+        """
+        Returns the cached result for the most similar query, if close enough.
+
+        Args:
+            query (np.ndarray): The normalized query vector.
+
+        Returns:
+            VectorizedKnowledge | None: The cached result, or None on miss.
+        """
+        if not self.results:
+            return None
+        count = len(self.results)
+        cached = self.vectors[:count].astype(np.float32) * self.scales[:count, None]
+        sims = cached @ query
+        best = int(np.argmax(sims))
+        if sims[best] > _KNN_SIMILARITY_THRESHOLD:
+            return self.results[best]
+        return None
+
+    def insert(self, query: np.ndarray, result: VectorizedKnowledge):
+        """
+        Stores a query vector and its result, evicting the oldest entry when full.
+
+        Args:
+            query (np.ndarray): The normalized query vector.
+            result (VectorizedKnowledge): The KNN result to cache.
+        """
+        if self.vectors is None:
+            self.vectors = np.zeros((_KNN_CACHE_MAX, query.shape[0]), dtype=np.int8)
+            self.scales = np.zeros(_KNN_CACHE_MAX, dtype=np.float32)
+        if len(self.results) < _KNN_CACHE_MAX:
+            self.results.append(result)
+        else:
+            self.results[self._write_index] = result
+        scale = float(np.max(np.abs(query))) / 127 or 1.0
+        self.vectors[self._write_index] = np.round(query / scale).astype(np.int8)
+        self.scales[self._write_index] = scale
+        self._write_index = (self._write_index + 1) % _KNN_CACHE_MAX
+
+
+# Keyed by (knowledge_base_id, frozenset(resource_ids)) so a changed filter
+# never returns a stale result set. Module-level because repositories are
+# rebuilt per unit of work.
+_knn_caches: dict[tuple[str, frozenset[str]], _QueryCache] = {}
+
 
 class OpensearchVectorizedKnowledgeRepository(VectorizedKnowledgeRepository):
     """
@@ -79,6 +158,17 @@ class OpensearchVectorizedKnowledgeRepository(VectorizedKnowledgeRepository):
                 knowledge_base_id=knowledge_base_id, resources=[]
             )
 
+        cache_key = (knowledge_base_id, frozenset(resource_ids))
+        query_vector = np.asarray(vectorized_query, dtype=np.float32)
+        norm = np.linalg.norm(query_vector)
+        if norm:
+            query_vector /= norm
+        cache = _knn_caches.get(cache_key)
+        if cache is not None:
+            cached_result = cache.lookup(query_vector)
+            if cached_result is not None:
+                return cached_result
+
         query = {
             "size": self._k,  # Limit the number of results to K
             "query": {
@@ -116,6 +206,92 @@ class OpensearchVectorizedKnowledgeRepository(VectorizedKnowledgeRepository):
             for hit in response["hits"]["hits"]
         ]
 
-        return VectorizedKnowledge(
+        result = VectorizedKnowledge(
             knowledge_base_id=knowledge_base_id, resources=knn_resources
         )  # Return the vectorized knowledge with KNN resources
+        if len(_knn_caches) >= _KNN_CACHE_MAX_KEYS:
+            _knn_caches.clear()
+        _knn_caches.setdefault(cache_key, _QueryCache()).insert(query_vector, result)
+        return result
+
+    async def get_with_knn(
+        self, knowledge_base_id: str, resource_ids: list[str], vectorized_query: list
+    ):
+        """
+        Retrieves the filtered resources and their K nearest neighbors in one round trip.
+
+        Bundles the terms query and the KNN query into a single msearch
+        request, so callers that need both pay one HTTP round trip to
+        OpenSearch instead of two.
+
+        Args:
+            knowledge_base_id (str): The ID of the knowledge base.
+            resource_ids (list[str]): The list of resource IDs to filter by.
+            vectorized_query (list): The vectorized query to find similar resources.
+
+        Returns:
+            tuple[VectorizedKnowledge, VectorizedKnowledge]: The filtered resources
+            and the K nearest neighbors, in that order.
+        """
+        if not resource_ids:
+            empty = VectorizedKnowledge(
+                knowledge_base_id=knowledge_base_id, resources=[]
+            )
+            return empty, empty
+
+        terms_query = {
+            "query": {
+                "bool": {
+                    "filter": [
+                        {"terms": {"resource_id": resource_ids}},
+                    ]
+                }
+            }
+        }
+        knn_query = {
+            "size": self._k,
+            "query": {
+                "bool": {
+                    "must": [
+                        {
+                            "knn": {
+                                "vector": {
+                                    "vector": vectorized_query,
+                                    "k": self._k,
+                                }
+                            }
+                        }
+                    ],
+                    "filter": [
+                        {"terms": {"resource_id": resource_ids}},
+                    ],
+                }
+            },
+        }
+        response = await self._client.msearch(
+            body=[
+                {"index": self._index},
+                terms_query,
+                {"index": self._index},
+                knn_query,
+            ]
+        )
+        resources, knn_resources = (
+            [
+                Resource(
+                    resource_id=hit["_source"]["resource_id"],
+                    vector=hit["_source"]["vector"],
+                    content=hit["_source"]["content"],
+                )
+                for hit in item["hits"]["hits"]
+            ]
+            for item in response["responses"]
+        )
+        return (
+            VectorizedKnowledge(
+                knowledge_base_id=knowledge_base_id, resources=resources
+            ),
+            VectorizedKnowledge(
+                knowledge_base_id=knowledge_base_id, resources=knn_resources
+            ),
+        )
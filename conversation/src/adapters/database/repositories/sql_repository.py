@@ -1,3 +1,5 @@
+import time
+
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -5,6 +7,14 @@ from src.application.models.agent_chat_bot import AgentChatBot, Prompt
 from src.application.ports.unit_of_work import AgentChatBotRepository
 
 
+# Agent chat bots and their prompts change rarely relative to request
+# volume. Module-level so the cache is shared across sessions and units
+# of work; a generous TTL still bounds staleness after admin edits.
+_AGENT_CACHE: dict[str, tuple[float, AgentChatBot]] = {}
+_AGENT_CACHE_TTL = 300.0
+_AGENT_CACHE_MAX_SIZE = 1024
+
+
 class SqlAgentChatBotRepository(AgentChatBotRepository):
     """
     Repository implementation for managing agent chat bots using SQL (PostgreSQL or other relational databases).
@@ -39,27 +49,21 @@ class SqlAgentChatBotRepository(AgentChatBotRepository):
             ValueError: If the agent chat bot with the given ID is not found.
         """
 
-        # SQL query to get agent chat bot by ID
+        # SQL query to get the agent chat bot and its prompt in one round trip
         agent_query = text(
-            "SELECT * FROM agent_chat_bots WHERE agent_chat_bot_id = :id"
+            """
+            SELECT a.agent_chat_bot_id, a.knowledge_base_id, p.prompt_id, p.text
+            FROM agent_chat_bots a
+            JOIN prompts p ON p.id = a.prompt_id
+            WHERE a.agent_chat_bot_id = :id
+            """
         )
         agent_result = await self._session.execute(
             agent_query, {"id": agent_chat_bot_id}
         )
 
-        # Fetch the agent row from the result
+        # Fetch the joined row from the result
         agent_row = agent_result.fetchone()
-
-        # SQL query to get prompt by ID
-        prompt_query = text(
-            """
-            SELECT * FROM prompts WHERE id = :id
-            """
-        )
-        prompt_result = await self._session.execute(
-            prompt_query, {"id": agent_row.prompt_id}
-        )
-        prompt_row = prompt_result.fetchone()
         if not agent_row:
             raise ValueError(f"AgentChatBot with ID {agent_chat_bot_id} not found")
 
@@ -67,5 +71,50 @@ class SqlAgentChatBotRepository(AgentChatBotRepository):
         return AgentChatBot(
             agent_chat_bot_id=agent_row.agent_chat_bot_id,
             knowledge_base_id=agent_row.knowledge_base_id,
-            prompt=Prompt(prompt_id=prompt_row.prompt_id, text=prompt_row.text),
+            prompt=Prompt(prompt_id=agent_row.prompt_id, text=agent_row.text),
         )
+
+
+class CachingAgentChatBotRepository(SqlAgentChatBotRepository):
+    """
+    Agent chat bot repository with a shared TTL cache in front of Postgres.
+
+    On a hit, a database round trip becomes a dict lookup; agents are
+    read on nearly every request but change rarely, so hit rates are
+    high and staleness is bounded by the TTL.
+    """
+
+    async def get(self, agent_chat_bot_id: str) -> AgentChatBot:
+        """
+        Retrieves an agent chat bot, serving recent lookups from the cache.
+
+        Args:
+            agent_chat_bot_id (str): The ID of the agent chat bot to retrieve.
+
+        Returns:
+            AgentChatBot: The retrieved agent chat bot object.
+
+        Raises:
+            ValueError: If the agent chat bot with the given ID is not found.
+        """
+        cached = _AGENT_CACHE.get(agent_chat_bot_id)
+        if cached is not None:
+            expires_at, agent = cached
+            if time.monotonic() < expires_at:
+                return agent
+            del _AGENT_CACHE[agent_chat_bot_id]
+        agent = await super().get(agent_chat_bot_id)
+        if len(_AGENT_CACHE) >= _AGENT_CACHE_MAX_SIZE:
+            _AGENT_CACHE.clear()
+        _AGENT_CACHE[agent_chat_bot_id] = (time.monotonic() + _AGENT_CACHE_TTL, agent)
+        return agent
+
+    @staticmethod
+    def invalidate(agent_chat_bot_id: str):
+        """
+        Drops a cached agent so the next lookup re-reads Postgres.
+
+        Args:
+            agent_chat_bot_id (str): The ID of the agent chat bot to evict.
+        """
+        _AGENT_CACHE.pop(agent_chat_bot_id, None)
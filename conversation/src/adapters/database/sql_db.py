@@ -14,9 +14,27 @@ def get_session_maker(database_url: str) -> async_sessionmaker[AsyncSession]:
     Returns:
         async_sessionmaker[AsyncSession]: The session maker for creating sessions.
     """
-    engine = create_async_engine(database_url, pool_size=10, max_overflow=20)
+    engine_kwargs = {
+        "pool_size": 20,
+        "max_overflow": 10,
+        "pool_timeout": 30,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        # LIFO checkout keeps a hot subset of connections busy so idle
+        # overflow connections age out and get reaped sooner.
+        "pool_use_lifo": True,
+    }
+    if database_url.startswith("postgresql"):
+        # Pin the asyncpg driver and keep its prepared statements hot; the
+        # custom analytics URL may point at another dialect, so only the
+        # Postgres path gets asyncpg-specific connect args.
+        database_url = database_url.replace(
+            "postgresql://", "postgresql+asyncpg://", 1
+        )
+        engine_kwargs["connect_args"] = {"statement_cache_size": 1024}
+    engine = create_async_engine(database_url, **engine_kwargs)
     session_maker = async_sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
+        engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
     )
     return session_maker
 
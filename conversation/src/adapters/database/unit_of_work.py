@@ -3,7 +3,11 @@ from opensearchpy import AsyncOpenSearch
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 from boto3_type_annotations.dynamodb import Client
-from src.adapters.database.repositories.sql_repository import SqlAgentChatBotRepository
+from src.adapters.database.commit_coordinator import CommitCoordinator
+from src.adapters.database.repositories.sql_repository import (
+    CachingAgentChatBotRepository,
+    SqlAgentChatBotRepository,
+)
 from src.adapters.database.repositories.dynamo_repository import (
     DynamoConversationRepository, DynamoBackgroundCheckRepository
 )
@@ -40,6 +44,7 @@ class UnitOfWorkImpl(UnitOfWork):
         opensearch_client: AsyncOpenSearch,
         dynamo_client: Client,
         knn_parameter: int,
+        commit_coordinator: CommitCoordinator | None = None,
     ) -> None:
         """
         Initializes the Unit of Work with session and repository clients.
@@ -48,31 +53,39 @@ class UnitOfWorkImpl(UnitOfWork):
             session (AsyncSession): The database session.
             opensearch_client (AsyncOpenSearch): The OpenSearch client for vectorized knowledge.
             dynamo_client (Client): The DynamoDB client for conversation management.
+            commit_coordinator (CommitCoordinator | None): Optional coordinator that
+                batches commits from concurrent requests on the shared session.
         """
         self._session = session
         self._session_custom = session_custom
         self._opensearch_client = opensearch_client
         self._dynamo_client = dynamo_client
         self._knn_parameter = knn_parameter
+        self._commit_coordinator = commit_coordinator
+        # Repositories are stateless beyond their clients; build them once
+        # here rather than on every __aenter__.
+        self.agent_chat_bots = CachingAgentChatBotRepository(session)
+        self.vectorized_knowledge = OpensearchVectorizedKnowledgeRepository(
+            opensearch_client, knn_parameter
+        )
+        self.conversations = DynamoConversationRepository(dynamo_client)
+        self.background_checks = DynamoBackgroundCheckRepository(dynamo_client)
 
     async def commit(self) -> None:
         """
         Commits the current transaction in the database.
         """
         logger.info("Committing transaction")
-        await self._session.commit()
+        if self._commit_coordinator is not None:
+            await self._commit_coordinator.commit()
+        else:
+            await self._session.commit()
 
     async def __aenter__(self):
         """
-        Begins a new unit of work, initializing repositories and returning the unit of work object.
+        Begins a new unit of work and returns the unit of work object.
         """
         logger.info("Starting new unit of work")
-        self.agent_chat_bots = SqlAgentChatBotRepository(self._session)
-        self.vectorized_knowledge = OpensearchVectorizedKnowledgeRepository(
-            self._opensearch_client, self._knn_parameter
-        )
-        self.conversations = DynamoConversationRepository(self._dynamo_client)
-        self.background_checks = DynamoBackgroundCheckRepository(self._dynamo_client)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -86,18 +99,33 @@ class UnitOfWorkImpl(UnitOfWork):
         """
         if exc_type:
             logger.error(f"Error occurred: {exc_val}")
-        self.agent_chat_bots = None  # type: ignore
-        self.vectorized_knowledge = None  # type: ignore
-        self.conversations = None  # type: ignore
+
+    async def stream(self, query: str, partition_size: int = 1000):
+        """
+        Streams query rows from the server in fixed-size partitions.
+
+        Rows are fetched with SQLAlchemy's streaming cursor, so memory
+        stays O(partition_size) regardless of result size and the first
+        row arrives after a single fetch round trip.
+
+        Args:
+            query (str): The SQL query to execute.
+            partition_size (int): How many rows to fetch per round trip.
+
+        Yields:
+            RowMapping: One dict-like row at a time.
+        """
+        result = await self._session_custom.stream(text(query))
+        async for partition in result.mappings().partitions(partition_size):
+            for row in partition:
+                yield row
 
     async def execute(self, query: str) -> list[dict]:
         try:
-            result = await self._session_custom.execute(text(query))
-
-            # Convert the result to a list of dictionaries
-            columns = result.keys()
-            res = [dict(zip(columns, row)) for row in result.fetchall()]
-            logger.info(res)
+            # RowMapping is already dict-like; reuse the mappings SQLAlchemy
+            # built instead of re-zipping columns into fresh dicts per row.
+            res = [row async for row in self.stream(query)]
+            logger.info(f"Query returned {len(res)} rows")
             return res
         except Exception as e:
             logger.info(e)
@@ -1,8 +1,12 @@
+import asyncio
+import hashlib
+
 import aiohttp
 from aiohttp import ClientError
 from aiohttp.web_exceptions import HTTPError
 from aws_lambda_powertools import Logger
 
+from src.adapters.circuit_breaker import CircuitBreaker
 from src.application.ports.api_client import (
     SourceManagementApiClient,
     VectorizerApiClient,
@@ -31,6 +35,9 @@ class HttpSourceManagementApiClient(SourceManagementApiClient):
         """
         self._session = session
         self._base_url = source_management_url
+        # Endpoint URL is static; build it once instead of per request.
+        self._resources_url = f"{source_management_url}/api/v1/resources"
+        self._breaker = CircuitBreaker()
 
     async def get_resource_ids_by_knowledge_base_id(
         self, knowledge_base_id: str
@@ -44,10 +51,11 @@ class HttpSourceManagementApiClient(SourceManagementApiClient):
         Returns:
             list[str]: A list of resource IDs associated with the knowledge base.
         """
-        url = f"{self._base_url}/api/v1/resources"
+        url = self._resources_url
         logger.info(
             f"HttpSourceManagementApiClient: Fetching resources ids with ID={knowledge_base_id}"
         )
+        self._breaker.check()
         try:
             async with self._session.get(
                 url, params={"knowledge_base_id": knowledge_base_id}
@@ -56,15 +64,20 @@ class HttpSourceManagementApiClient(SourceManagementApiClient):
                     logger.error(
                         f"Error fetching resources ids by knowledge_base_id data for ID={knowledge_base_id}: HTTP {response.status}"
                     )
+                    # Downstream error statuses must trip the breaker too,
+                    # not just transport-level failures.
+                    self._breaker.record_failure()
                     raise HTTPError()
                 resource_ids_data = await response.json()
             logger.info(
                 f"HttpSourceManagementApiClient: Successfully fetched resource ids data for ID={knowledge_base_id}"
             )
+            self._breaker.record_success()
             return resource_ids_data.get("resource_ids", [])
-        except ClientError as e:
+        except (ClientError, asyncio.TimeoutError) as e:
+            self._breaker.record_failure()
             logger.error(
-                f"HTTP ClientError while fetching resource ids with ID={knowledge_base_id}: {str(e)}"
+                f"HTTP error while fetching resource ids with ID={knowledge_base_id}: {str(e)}"
             )
             raise
 
@@ -88,6 +101,14 @@ class HttpVectorizerApiClient(VectorizerApiClient):
         """
         self._session = session
         self._base_url = vectorize_service_url
+        # Endpoint URL is static; build it once instead of per request.
+        self._vectorize_url = f"{vectorize_service_url}/api/v1/vectorize_text"
+        self._breaker = CircuitBreaker()
+        # Embeddings for recently vectorized texts, keyed by SHA-256 of the
+        # input. Repeated queries skip the HTTP POST and the upstream model
+        # call entirely; dicts keep insertion order, so eviction is LRU.
+        self._cache: dict[bytes, list] = {}
+        self._cache_max_size = 4096
 
     async def vectorize_text(self, text: str) -> list:
         """
@@ -99,20 +120,35 @@ class HttpVectorizerApiClient(VectorizerApiClient):
         Returns:
             list: The vectorized representation of the text.
         """
-        url = f"{self._base_url}/api/v1/vectorize_text"
+        url = self._vectorize_url
         logger.info(
             "HttpVectorizerApiClient: Vectorizing text", extra={"vectorize_text": text}
         )
+        key = hashlib.sha256(text.encode()).digest()
+        cached = self._cache.pop(key, None)
+        if cached is not None:
+            # Re-insert to mark the entry as most recently used.
+            self._cache[key] = cached
+            logger.info("HttpVectorizerApiClient: Returning cached embedding")
+            return cached
+        self._breaker.check()
         try:
             async with self._session.post(url, json={"text": text}) as response:
                 if response.status != 200:
                     logger.error(f"Error vectorizing text: {response.status}")
+                    # Downstream error statuses must trip the breaker too,
+                    # not just transport-level failures.
+                    self._breaker.record_failure()
                     raise HTTPError()
                 vectorized_text = await response.json()
                 logger.info("HttpVectorizerApiClient: Successfully vectorized text")
-            return vectorized_text.get("vectorized_text", [])
-        except ClientError as e:
-            logger.error(
-                f"HTTP ClientError while vectorizing text: {response.status}: {str(e)}"
-            )
+            self._breaker.record_success()
+            embedding = vectorized_text.get("vectorized_text", [])
+            if len(self._cache) >= self._cache_max_size:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[key] = embedding
+            return embedding
+        except (ClientError, asyncio.TimeoutError) as e:
+            self._breaker.record_failure()
+            logger.error(f"HTTP error while vectorizing text: {str(e)}")
             raise
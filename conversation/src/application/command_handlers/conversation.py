@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 
 from aws_lambda_powertools import Logger
@@ -84,11 +85,11 @@ class ConversationCommandHandler(BaseCommandHandler):
             )
             conversation.messages.append(user_message)
 
-            # Fetch the agent details associated with the conversation
-            agent = await uow.agent_chat_bots.get(conversation.agent_chat_bot_id)
-
-            sql_query = await self._ai_service.generate_sql_response(
-                command.message
+            # The agent lookup and SQL generation are independent, so run
+            # them concurrently instead of paying for both round trips.
+            agent, sql_query = await asyncio.gather(
+                uow.agent_chat_bots.get(conversation.agent_chat_bot_id),
+                self._ai_service.generate_sql_response(command.message),
             )
 
             # Retrieve knowledge from the vectorized knowledge base
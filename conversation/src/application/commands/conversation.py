@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from src.application.commands.base import BaseCommand
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConversationCommand(BaseCommand):
     """
     Command model for processing a conversation.
@@ -21,6 +21,7 @@ class Message:
     role: str
     user_id: str
     timestamp: datetime = datetime.now(timezone.utc)
+    _ai_dict: dict | None = field(default=None, repr=False, compare=False)
 
     def to_dict(self) -> dict:
         """
@@ -41,13 +42,18 @@ class Message:
         """
         Converts the message to a dictionary format suitable for AI service consumption.
 
+        Past messages never change mid-conversation, so the dict is built
+        once per message and reused on every subsequent turn.
+
         Returns:
             dict: The serialized message for AI service.
         """
-        return {
-            "role": self.role,
-            "content": [{"type": "text", "text": self.content}],
-        }
+        if self._ai_dict is None:
+            self._ai_dict = {
+                "role": self.role,
+                "content": [{"type": "text", "text": self.content}],
+            }
+        return self._ai_dict
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Message:
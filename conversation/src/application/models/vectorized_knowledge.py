@@ -30,3 +30,22 @@ class VectorizedKnowledge:
 
     knowledge_base_id: str
     resources: list[Resource]
+    _rendered: str | None = None
+
+    def render_resources(self) -> str:
+        """
+        Renders the resources as a prompt fragment, one per line.
+
+        The result is computed once and reused for the lifetime of this
+        object, so repeated turns over the same knowledge base do not
+        rebuild the string.
+
+        Returns:
+            str: The resources formatted for a system prompt.
+        """
+        if self._rendered is None:
+            self._rendered = "\n".join(
+                f"Resource: {resource.resource_id} Content: {resource.content}"
+                for resource in self.resources
+            )
+        return self._rendered
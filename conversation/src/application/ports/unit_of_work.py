@@ -12,6 +12,7 @@ class VectorizedKnowledgeRepository(ABC):
     Methods:
         get: Fetches vectorized knowledge for a specific knowledge base and resource IDs.
         get_knn: Retrieves the k-nearest neighbors for a vectorized query.
+        get_with_knn: Fetches the resources and their k-nearest neighbors together.
     """
 
     @abstractmethod
@@ -24,6 +25,12 @@ class VectorizedKnowledgeRepository(ABC):
     ):
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_with_knn(
+        self, knowledge_base_id: str, resource_ids: list[str], vectorized_query: list
+    ):
+        raise NotImplementedError
+
 
 class AgentChatBotRepository(ABC):
     """
@@ -45,16 +52,25 @@ class ConversationRepository(ABC):
     Methods:
         get: Fetches a conversation by its ID.
         save: Saves a conversation to the database.
+        save_many: Saves several conversations in batched writes.
     """
 
     @abstractmethod
     async def get(self, conversation_id: str) -> Conversation | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_many(self, conversation_ids: list[str]) -> list[Conversation]:
+        raise NotImplementedError
+
     @abstractmethod
     async def save(self, conversation: Conversation):
         raise NotImplementedError
 
+    @abstractmethod
+    async def save_many(self, conversations: list[Conversation]):
+        raise NotImplementedError
+
 
 class BackgroundCheckRepository(ABC):
     """
@@ -103,3 +119,7 @@ class UnitOfWork(ABC):
     @abstractmethod
     async def execute(self, query: str) -> list[dict]:
         raise NotImplementedError
+
+    @abstractmethod
+    def stream(self, query: str, partition_size: int = 1000):
+        raise NotImplementedError
@@ -1,7 +1,7 @@
-from fastapi import Depends, APIRouter
-from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter
 
 from src.entrypoints.api.models import api_models
+from src.entrypoints.api.responses import ORJSONResponse
 from src.entrypoints.api.ioc import Container
 from aws_lambda_powertools import Logger
 
@@ -16,15 +16,33 @@ from src.application.commands.create_conversation import CreateConversationComma
 router = APIRouter()
 logger = Logger("fast_api_handlers")
 
+# Command handlers resolved once at startup; both are container
+# singletons, so resolving them per request through Depends(Provide[...])
+# only added dependency-graph traversal to every call.
+_conversation_handler: ConversationCommandHandler = None  # type: ignore
+_create_conversation_handler: CreateConversationCommandHandler = None  # type: ignore
+
+
+async def init_handlers(container: Container) -> None:
+    """
+    Resolves the command handler singletons from the container.
+
+    Resolution goes through async_() because the provider graph contains
+    the async session resource; a sync call would hand back an
+    un-awaited Future instead of a handler.
+
+    Args:
+        container (Container): The initialized dependency injection container.
+    """
+    global _conversation_handler, _create_conversation_handler
+    _conversation_handler = await container.conversation_handler.async_()
+    _create_conversation_handler = await container.create_conversation_handler.async_()
+
 
 @router.post("/v1/conversations/messages")
-@inject
 async def conversation(
     request: api_models.ConversationRequest,
-    handler: ConversationCommandHandler = Depends(
-        Provide[Container.conversation_handler]
-    ),
-) -> api_models.ConversationResponse:
+) -> ORJSONResponse:
     """
     Handles incoming requests for conversations. The function takes a
     ConversationRequest, processes it using a ConversationCommandHandler, and
@@ -32,38 +50,31 @@ async def conversation(
 
     Args:
         request (api_models.ConversationRequest): The incoming conversation request.
-        handler (ConversationCommandHandler): The command handler to process the request.
 
     Returns:
-        api_models.ConversationResponse: The response containing conversation data.
+        ORJSONResponse: The response containing conversation data.
     """
-    logger.info(f"Received request for  conversation: {request}")
-
     # Create a command object from the request data
-    command = ConversationCommand(**request.model_dump())
-    logger.info(f"Created command: {command}")
+    # __dict__ reuses the already-validated field values without a
+    # recursive pydantic dump
+    command = ConversationCommand(**request.__dict__)
 
-    # Log the handler instance before execution
-    logger.info(f"Handler instance before execution: {handler}")
     # Execute the handler with the created command
-    result = await handler(command)
-    logger.info("Handler execution completed")
+    result = await _conversation_handler(command)
+    logger.info(
+        "Conversation message handled",
+        extra={"conversation_id": request.conversation_id},
+    )
 
-    # Create the response from the result and return it
-    response = api_models.ConversationResponse(**result)
-    logger.info(f"Returning response: {response}")
-    return response
+    # Serialize the result directly; no response-model re-validation
+    return ORJSONResponse(result)
 
 
 # Lambda function for creating a conversation
 @router.post("/v1/conversations")
-@inject
 async def create_conversation(
     request: api_models.CreateConversationRequest,
-    handler: CreateConversationCommandHandler = Depends(
-        Provide[Container.create_conversation_handler]
-    ),
-) -> api_models.ConversationResponse:
+) -> ORJSONResponse:
     """
     Handles requests to create a new conversation. It uses the
     CreateConversationCommandHandler to process the request and return a
@@ -71,24 +82,22 @@ async def create_conversation(
 
     Args:
         request (api_models.CreateConversationRequest): The request to create a conversation.
-        handler (CreateConversationCommandHandler): The handler to process the creation.
 
     Returns:
-        api_models.ConversationResponse: The response containing the newly created conversation's data.
+        ORJSONResponse: The response containing the newly created conversation's data.
     """
-    logger.info(f"Received request for create conversation: {request}")
     # Create a command object from the request data
-    command = CreateConversationCommand(**request.model_dump())
-    logger.info(f"Created command: {command}")
-
-    # Log the handler instance before execution
-    logger.info(f"Handler instance before execution: {handler}")
+    # __dict__ reuses the already-validated field values without a
+    # recursive pydantic dump
+    command = CreateConversationCommand(**request.__dict__)
 
     # Execute the handler with the created command
-    result = await handler(command)
+    result = await _create_conversation_handler(command)
+    logger.info(
+        "Conversation created",
+        extra={"agent_chat_bot_id": request.agent_chat_bot_id},
+    )
     logger.info("Handler execution completed")
 
-    # Create the response from the result and return it
-    response = api_models.CreateConversationResponse(**result)
-    logger.info(f"Returning response: {response}")
-    return response
\ No newline at end of file
+    # Serialize the result directly; no response-model re-validation
+    return ORJSONResponse(result)
\ No newline at end of file
@@ -1,8 +1,11 @@
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.entrypoints.api import fastapi_handlers
 from src.entrypoints.api.ioc import Container
+from src.entrypoints.api.responses import ORJSONResponse
 
 
 class ServiceBootStrap:
@@ -26,7 +29,7 @@ class ServiceBootStrap:
         """
         container = Container()
         container.init_resources()
-        service_api: FastAPI = FastAPI()
+        service_api: FastAPI = FastAPI(default_response_class=ORJSONResponse)
         service_api.container = container
         service_api.include_router(
             fastapi_handlers.router,
@@ -34,12 +37,28 @@ class ServiceBootStrap:
         )
         service_api.add_middleware(
             CORSMiddleware,
-            allow_origins=["*"],
+            allow_origins=os.environ.get("CORS_ALLOW_ORIGINS", "*").split(","),
             allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
+            # Explicit lists let the middleware precompute allowed sets
+            # instead of taking the wildcard branch on every request.
+            allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+            allow_headers=["Authorization", "Content-Type", "X-User-ID"],
         )
         return service_api
 
 
 app = ServiceBootStrap.create_service_api()
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Resolves the handlers and pre-creates a database connection.
+
+    Handler resolution happens here rather than at import time because
+    the async session resource can only be initialized inside the
+    running event loop.
+    """
+    await fastapi_handlers.init_handlers(app.container)
+    session_maker = app.container.db_session_maker()
+    async with session_maker() as session:
+        await session.connection()
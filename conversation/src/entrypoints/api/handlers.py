@@ -1,10 +1,7 @@
+from functools import cache
+
 from aws_lambda_powertools import Logger
-from dependency_injector.wiring import inject, Provide, Closing
 
-from src.application.command_handlers.conversation import ConversationCommandHandler
-from src.application.command_handlers.create_conversation import (
-    CreateConversationCommandHandler,
-)
 from src.application.commands.conversation import ConversationCommand
 from src.application.commands.create_conversation import CreateConversationCommand
 from src.entrypoints.api.ioc import Container
@@ -15,14 +12,40 @@ from src.entrypoints.api.models import api_models
 logger = Logger("handlers")
 
 
+@cache
+def _get_container() -> Container:
+    """
+    Builds the DI container on first invocation.
+
+    Deferring construction past import time keeps the Lambda init phase
+    short; warm invocations reuse the cached container and its pooled
+    clients.
+
+    Returns:
+        Container: The initialized dependency injection container.
+    """
+    return Container()
+
+
+async def _release_db_sessions() -> None:
+    """
+    Ends the implicit transactions left open by an invocation.
+
+    The session resources persist for the life of the warm container and
+    the handlers never commit, so without a rollback the first Postgres
+    read would pin an idle-in-transaction connection indefinitely. The
+    rollback returns the connection to the pool; the session itself is
+    reused by the next invocation.
+    """
+    container = _get_container()
+    await (await container.db_session_factory.async_()).rollback()
+    await (await container.db_session_factory_custom.async_()).rollback()
+
+
 # Lambda function for handling conversation requests
 @lambda_handler_decorator(api_models.ConversationRequest)
-@inject
 async def conversation(
     request: api_models.ConversationRequest,
-    handler: ConversationCommandHandler = Closing[
-        Provide[Container.conversation_handler]
-    ],
 ) -> api_models.ConversationResponse:
     """
     Handles incoming requests for conversations. The function takes a
@@ -31,7 +54,6 @@ async def conversation(
 
     Args:
         request (api_models.ConversationRequest): The incoming conversation request.
-        handler (ConversationCommandHandler): The command handler to process the request.
 
     Returns:
         api_models.ConversationResponse: The response containing conversation data.
@@ -42,11 +64,13 @@ async def conversation(
     command = ConversationCommand(**request.model_dump())
     logger.info(f"Created command: {command}")
 
-    # Log the handler instance before execution
-    logger.info(f"Handler instance before execution: {handler}")
-
-    # Execute the handler with the created command
-    result = await handler(command)
+    # Execute the handler with the created command; async_() resolves the
+    # session resource inside the running event loop.
+    try:
+        handler = await _get_container().conversation_handler.async_()
+        result = await handler(command)
+    finally:
+        await _release_db_sessions()
     logger.info("Handler execution completed")
 
     # Create the response from the result and return it
@@ -57,12 +81,8 @@ async def conversation(
 
 # Lambda function for creating a conversation
 @lambda_handler_decorator(api_models.CreateConversationRequest)
-@inject
 async def create_conversation(
     request: api_models.CreateConversationRequest,
-    handler: CreateConversationCommandHandler = Closing[
-        Provide[Container.create_conversation_handler]
-    ],
 ) -> api_models.ConversationResponse:
     """
     Handles requests to create a new conversation. It uses the
@@ -71,7 +91,6 @@ async def create_conversation(
 
     Args:
         request (api_models.CreateConversationRequest): The request to create a conversation.
-        handler (CreateConversationCommandHandler): The handler to process the creation.
 
     Returns:
         api_models.ConversationResponse: The response containing the newly created conversation's data.
@@ -81,20 +100,16 @@ async def create_conversation(
     command = CreateConversationCommand(**request.model_dump())
     logger.info(f"Created command: {command}")
 
-    # Log the handler instance before execution
-    logger.info(f"Handler instance before execution: {handler}")
-
-    # Execute the handler with the created command
-    result = await handler(command)
+    # Execute the handler with the created command; async_() resolves the
+    # session resource inside the running event loop.
+    try:
+        handler = await _get_container().create_conversation_handler.async_()
+        result = await handler(command)
+    finally:
+        await _release_db_sessions()
     logger.info("Handler execution completed")
 
     # Create the response from the result and return it
     response = api_models.CreateConversationResponse(**result)
     logger.info(f"Returning response: {response}")
     return response
-
-
-# Dependency Injection Container setup
-container = Container()
-# Wire the container for dependency injection
-container.wire(modules=[__name__])
@@ -1,18 +1,20 @@
-import json
 import os
 import traceback
 
 import aiohttp
 import boto3
-from anthropic import Anthropic
+import orjson
+from botocore.config import Config
+from anthropic import AsyncAnthropic
 from aws_lambda_powertools import Logger
-from aws_secretsmanager_caching import SecretCache, SecretCacheConfig
+from aws_lambda_powertools.utilities import parameters
 from dependency_injector import providers
-from dependency_injector.containers import DeclarativeContainer, WiringConfiguration
+from dependency_injector.containers import DeclarativeContainer
 from openai import AsyncOpenAI
 from opensearchpy import AsyncOpenSearch
 
 from src.adapters.claude_ai_service import ClaudeAIService
+from src.adapters.database.commit_coordinator import CommitCoordinator
 from src.adapters.database.sql_db import get_session_maker, get_session, get_custom_session
 from src.adapters.database.unit_of_work import UnitOfWorkImpl
 from src.adapters.http_api_client import (
@@ -29,12 +31,14 @@ from src.application.command_handlers.create_conversation import (
 logger = Logger(service="ioc")
 
 
-def get_secret(secrets_cache: SecretCache, env: str) -> dict:
+def get_secret(env: str) -> dict:
     """
     Retrieves secrets from AWS Secrets Manager.
 
+    Uses powertools' parameters utility, which keeps a client-side cache
+    (max_age=600) so warm starts skip the Secrets Manager round trip.
+
     Args:
-        secrets_cache (SecretCache): AWS Secrets Manager cache instance
         env (str): Environment(dev/prod)
 
     Returns:
@@ -46,9 +50,7 @@ def get_secret(secrets_cache: SecretCache, env: str) -> dict:
     secret_name = f"{env}/ai-custom-bot/conversation"
     try:
         logger.info(f"Getting secret {secret_name}")
-        secret_value = secrets_cache.get_secret_string(secret_name)
-        logger.info(f"Secret value {secret_value}")
-        return json.loads(secret_value)
+        return parameters.get_secret(secret_name, transform="json", max_age=600)
     except Exception as e:
         logger.info(e)
         logger.info(traceback.format_exc())
@@ -68,21 +70,17 @@ class Container(DeclarativeContainer):
 
     region = os.environ.get("REGION")
     environment = os.environ.get("ENVIRONMENT")
-    logger.info("Initializing Container")
-    # AWS and database client setup
-    secrets_manager_client = boto3.client("secretsmanager", region_name=region)
-    wiring_config = WiringConfiguration(modules=[".fastapi_handlers"])
-    cache_config = SecretCacheConfig()
-    secrets_cache = SecretCache(config=cache_config, client=secrets_manager_client)
-    secrets = get_secret(secrets_cache, environment)
+    # Secrets are fetched lazily on first provider resolution so importing
+    # this module never blocks on Secrets Manager.
+    secrets = providers.Singleton(get_secret, env=environment)
 
     # Opensearch client configuration
     elastic_search_client = providers.Singleton(
         AsyncOpenSearch,
-        hosts=[secrets.get("opensearch_host")],
-        http_auth=(
-            secrets.get("opensearch_username"),
-            secrets.get("opensearch_password"),
+        hosts=providers.List(secrets.provided.get.call("opensearch_host")),
+        http_auth=providers.List(
+            secrets.provided.get.call("opensearch_username"),
+            secrets.provided.get.call("opensearch_password"),
         ),
         verify_certs=True,
         timeout=60,
@@ -92,55 +90,77 @@ class Container(DeclarativeContainer):
 
     # Application components
     anthropic_client = providers.Singleton(
-        Anthropic, api_key=secrets.get("claude_api_key")
+        AsyncAnthropic,
+        api_key=secrets.provided.get.call("claude_api_key"),
+        # SDK-native retries with jittered backoff on rate limits and 5xx.
+        max_retries=3,
     )
 
     openai_client = providers.Singleton(
-        AsyncOpenAI, api_key=secrets.get("openai_api_key")
+        AsyncOpenAI, api_key=secrets.provided.get.call("openai_api_key")
     )
 
     ai_service = providers.Singleton(
         ClaudeAIService,
         client=anthropic_client,
-        temperature=float(secrets.get("claude_temperature", 0)),
-        max_tokens=int(secrets.get("claude_max_tokens", 1000)),
-        system_prompt=secrets.get("claude_system_prompt", ""),
+        temperature=providers.Callable(
+            float, secrets.provided.get.call("claude_temperature", 0)
+        ),
+        max_tokens=providers.Callable(
+            int, secrets.provided.get.call("claude_max_tokens", 1000)
+        ),
+        system_prompt=secrets.provided.get.call("claude_system_prompt", ""),
     )
 
     ai_service_openai = providers.Singleton(
         OpenAIService,
         client=openai_client,
-        temperature=float(secrets.get("claude_temperature", 0)),
-        max_tokens=int(secrets.get("claude_max_tokens", 1000)),
-        system_prompt=secrets.get("claude_system_prompt", ""),
-        sql_prompt=secrets.get("sql_prompt", ""),
-        schema=secrets.get("schema", ""),
+        temperature=providers.Callable(
+            float, secrets.provided.get.call("claude_temperature", 0)
+        ),
+        max_tokens=providers.Callable(
+            int, secrets.provided.get.call("claude_max_tokens", 1000)
+        ),
+        system_prompt=secrets.provided.get.call("claude_system_prompt", ""),
+        sql_prompt=secrets.provided.get.call("sql_prompt", ""),
+        schema=secrets.provided.get.call("schema", ""),
     )
 
     http_session = providers.Singleton(
         aiohttp.ClientSession,
+        # aiohttp serializes json= bodies with stdlib json by default;
+        # route it through orjson like the response path.
+        json_serialize=lambda obj: orjson.dumps(obj).decode(),
     )
     source_management_api_client = providers.Singleton(
         HttpSourceManagementApiClient,
         session=http_session,
-        source_management_url=secrets.get("source_management_url"),
+        source_management_url=secrets.provided.get.call("source_management_url"),
     )
 
     vectorizer_api_client = providers.Singleton(
         HttpVectorizerApiClient,
         session=http_session,
-        vectorize_service_url=secrets.get("vectorize_service_url"),
+        vectorize_service_url=secrets.provided.get.call("vectorize_service_url"),
     )
 
-    # Dynamo client configuration
+    # Dynamo client configuration; keep-alive avoids a TCP+TLS handshake
+    # per call and the adaptive retry mode backs off under throttling.
     dynamo_client = providers.Singleton(
-        boto3.resource, service_name="dynamodb", region_name=region
+        boto3.resource,
+        service_name="dynamodb",
+        region_name=region,
+        config=Config(
+            tcp_keepalive=True,
+            max_pool_connections=64,
+            retries={"mode": "adaptive", "max_attempts": 5},
+        ),
     )
 
     # SQL client configuration
-    db_session_maker = providers.Resource(
+    db_session_maker = providers.Singleton(
         get_session_maker,
-        database_url=secrets.get("database_url"),
+        database_url=secrets.provided.get.call("database_url"),
     )
 
     db_session_factory = providers.Resource(
@@ -148,9 +168,9 @@ class Container(DeclarativeContainer):
         session_maker=db_session_maker,
     )
 
-    db_session_maker_custom = providers.Resource(
+    db_session_maker_custom = providers.Singleton(
         get_session_maker,
-        database_url=secrets.get("custom_database_url"),
+        database_url=secrets.provided.get.call("custom_database_url"),
     )
 
     db_session_factory_custom = providers.Resource(
@@ -158,13 +178,22 @@ class Container(DeclarativeContainer):
         session_maker=db_session_maker_custom,
     )
 
+    commit_coordinator = providers.Singleton(
+        CommitCoordinator,
+        session=db_session_factory,
+        window=providers.Callable(
+            float, secrets.provided.get.call("commit_debounce_window", 0.005)
+        ),
+    )
+
     unit_of_work = providers.Factory(
         UnitOfWorkImpl,
         session=db_session_factory,
         opensearch_client=elastic_search_client,
         dynamo_client=dynamo_client,
-        knn_parameter=secrets.get("knn_parameter"),
-        session_custom=db_session_factory_custom
+        knn_parameter=secrets.provided.get.call("knn_parameter"),
+        session_custom=db_session_factory_custom,
+        commit_coordinator=commit_coordinator,
     )
 
     # Command handlers configuration
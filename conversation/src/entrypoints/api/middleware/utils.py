@@ -1,13 +1,12 @@
-import json
 import base64
 import asyncio
 import traceback
 from typing import Callable, Awaitable, Any, Type
 
-
+import orjson
 from pydantic import BaseModel
 from aws_lambda_powertools import Logger
-from aws_lambda_powertools.utilities.parser import parse, ValidationError
+from aws_lambda_powertools.utilities.parser import ValidationError
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
 
@@ -43,9 +42,9 @@ def lambda_handler_decorator(
                 body_raw = event.get("body")
                 if body_raw:
                     try:
-                        body_parameters = json.loads(body_raw) or {}
-                    except json.JSONDecodeError:
-                        body_parameters = json.loads(base64.b64decode(event["body"]))
+                        body_parameters = orjson.loads(body_raw) or {}
+                    except orjson.JSONDecodeError:
+                        body_parameters = orjson.loads(base64.b64decode(event["body"]))
                 else:
                     body_parameters = {}
                 query_parameters = event.get("queryStringParameters", {}) or {}
@@ -58,7 +57,7 @@ def lambda_handler_decorator(
                 }
 
                 # Validate and process request
-                request = parse(model=model, event=event_data)
+                request = model.model_validate(event_data)
                 logger.info("start execute handler")
                 result = loop.run_until_complete(handler(request))
 
@@ -69,7 +68,7 @@ def lambda_handler_decorator(
                         "Access-Control-Allow-Headers": "Content-Type",
                         "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE",
                     },
-                    "body": json.dumps(result.model_dump()),
+                    "body": orjson.dumps(result.model_dump()).decode(),
                 }
             except ValidationError as e:
                 logger.error(msg=f"Validation error: {e}")
@@ -81,9 +80,9 @@ def lambda_handler_decorator(
                         "Access-Control-Allow-Headers": "Content-Type",
                         "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE",
                     },
-                    "body": json.dumps(
+                    "body": orjson.dumps(
                         {"__type": "Validation error", "message": str(e)}
-                    ),
+                    ).decode(),
                 }
             except Exception as e:
                 logger.error(msg=traceback.format_exc())
@@ -94,9 +93,9 @@ def lambda_handler_decorator(
                         "Access-Control-Allow-Headers": "Content-Type",
                         "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE",
                     },
-                    "body": json.dumps(
+                    "body": orjson.dumps(
                         {"__type": "InternalServerError", "message": ""}
-                    ),
+                    ).decode(),
                 }
 
         return wrapper
@@ -0,0 +1,38 @@
+from typing import Any
+from uuid import UUID
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    """
+    Fallback serializer for types orjson does not handle natively.
+
+    Args:
+        obj (Any): The object being serialized.
+
+    Returns:
+        Any: A JSON-serializable representation of the object.
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, UUID):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Returning this directly from a handler skips FastAPI's
+    jsonable_encoder and response-model validation passes, leaving a
+    single C-extension serialization per response.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NAIVE_UTC)
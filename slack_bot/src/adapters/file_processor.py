@@ -15,6 +15,8 @@ logger = Logger("file_processor")
 class FileProcessorImpl(FileProcessor):
     def __init__(self, token: str):
         self.token = token
+        # Reuse one connection to Slack's file host across downloads.
+        self._session = requests.Session()
         self.supported_types = {
             "application/pdf": self._process_pdf,
             "application/vnd.openxmlformats-officedocument.wordprocessingml.document": self._process_docx,
@@ -45,7 +47,7 @@ class FileProcessorImpl(FileProcessor):
     def _download_file(self, file_url: str) -> bytes | None:
         try:
             headers = {"Authorization": f"Bearer {self.token}"}
-            response = requests.get(file_url, headers=headers)
+            response = self._session.get(file_url, headers=headers)
             response.raise_for_status()
             return response.content
         except Exception as e:
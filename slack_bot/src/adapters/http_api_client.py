@@ -2,7 +2,6 @@ import random
 import time
 from typing import Any
 
-import requests
 from aws_lambda_powertools import Logger
 from requests import RequestException, Session, HTTPError
 
@@ -18,6 +17,14 @@ logger = Logger("http_api_client")
 class HttpConversationApiClient(ConversationApiClient):
     def __init__(self, conversation_url: str):
         self._base_url = conversation_url
+        # A shared Session keeps the TCP+TLS connection to the conversation
+        # service alive across calls instead of re-handshaking per request.
+        self._session = Session()
+        # Endpoint URLs are static; build them once instead of per call.
+        self._messages_url = conversation_url + "/api/v1/conversations/messages"
+        self._background_checks_url = (
+            conversation_url + "/api/v1/conversations/messages/background_checks"
+        )
         self._max_retries = 3
         self._initial_backoff = 0.5
         self._max_backoff = 60.0
@@ -76,7 +83,7 @@ class HttpConversationApiClient(ConversationApiClient):
                     extra={"text": message, "conversation_id": conversation_id, "url": url},
                 )
 
-                response = requests.post(url, json=data, timeout=30)
+                response = self._session.post(url, json=data, timeout=30)
 
                 # Check if status code is in retry list
                 if response.status_code in self._retry_on_status_codes:
@@ -140,8 +147,9 @@ class HttpConversationApiClient(ConversationApiClient):
         Returns:
             Dict[str, Any]: Response from the API
         """
-        url = self._base_url + "/api/v1/conversations/messages"
-        return self._base_send_message(url, conversation_id, message, user_id)
+        return self._base_send_message(
+            self._messages_url, conversation_id, message, user_id
+        )
 
     def send_message_background_check(
         self, conversation_id: str, message: str, user_id: str
@@ -157,16 +165,19 @@ class HttpConversationApiClient(ConversationApiClient):
         Returns:
             Dict[str, Any]: Response from the API
         """
-        url = self._base_url + "/api/v1/conversations/messages/background_checks"
-        return self._base_send_message(url, conversation_id, message, user_id)
+        return self._base_send_message(
+            self._background_checks_url, conversation_id, message, user_id
+        )
 
 
 class HttpResourceManagerApiClient(ResourceManagerApiClient):
     def __init__(self, source_management_url: str):
         self._base_url = source_management_url
+        self._session = Session()
+        self._resources_url = source_management_url + "/api/v1/resources"
 
     def add_resource(self, channel_id: str, messages: list[dict]):
-        url = self._base_url + "/api/v1/resources"
+        url = self._resources_url
         logger.info(
             "HttpResourceManagerApiClient: Conversation",
             extra={"channel_id": channel_id},
@@ -178,7 +189,7 @@ class HttpResourceManagerApiClient(ResourceManagerApiClient):
             "messages": messages,
         }
         try:
-            response = requests.post(url, json=data)
+            response = self._session.post(url, json=data)
             if response.status_code != 200:
                 logger.error(f"Error add resource: {response.status_code}")
                 response.raise_for_status()
@@ -1,5 +1,6 @@
-from fastapi import Depends, APIRouter
-from dependency_injector.wiring import Provide, inject
+from functools import lru_cache
+
+from fastapi import APIRouter
 
 from src.adapters.fasttext_vectorizer import FastTextVectorizer
 from src.entrypoints.api.ioc import Container
@@ -15,14 +16,22 @@ router = APIRouter()
 logger = Logger(service="VectorizationService")
 
 
+@lru_cache(maxsize=1)
+def _vectorize_service() -> FastTextVectorizer:
+    """
+    Resolves the singleton FastText vectorizer once.
+
+    A plain cached factory avoids @inject's per-request signature
+    introspection while still deferring resolution past import time.
+
+    Returns:
+        FastTextVectorizer: The FastText vectorization service.
+    """
+    return Container.fasttext_vectorizer()
+
+
 @router.post("/v1/vectorize_text")
-@inject
-async def vectorize_text(
-    request: VectorizeTextRequest,
-    vectorize_service: FastTextVectorizer = Depends(
-        Provide[Container.fasttext_vectorizer]
-    ),
-):
+async def vectorize_text(request: VectorizeTextRequest):
     """
     Vectorize raw text using FastText model.
 
@@ -31,12 +40,11 @@ async def vectorize_text(
 
     Args:
         request (VectorizeTextRequest): Request containing the text to vectorize
-        vectorize_service (FastTextVectorizer): Injected FastText vectorization service
 
     Returns:
         VectorizeTextResponse: Response containing the vectorized text representation
     """
     logger.info("Received vectorize text request", extra={"request": request})
-    vector = await vectorize_service.vectorize_text(request.text)
+    vector = await _vectorize_service().vectorize_text(request.text)
     logger.info("Vectorization completed successfully")
     return VectorizeTextResponse(vectorized_text=vector)
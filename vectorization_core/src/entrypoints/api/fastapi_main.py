@@ -1,5 +1,8 @@
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.entrypoints.api import fastapi_handlers
 from src.entrypoints.api.ioc import Container
@@ -26,7 +29,7 @@ class ServiceBootStrap:
         """
         container = Container()
         container.init_resources()
-        service_api: FastAPI = FastAPI()
+        service_api: FastAPI = FastAPI(default_response_class=ORJSONResponse)
         service_api.container = container
         service_api.include_router(
             fastapi_handlers.router,
@@ -34,10 +37,12 @@ class ServiceBootStrap:
         )
         service_api.add_middleware(
             CORSMiddleware,
-            allow_origins=["*"],
+            allow_origins=os.environ.get("CORS_ALLOW_ORIGINS", "*").split(","),
             allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
+            # Explicit lists let the middleware precompute allowed sets
+            # instead of taking the wildcard branch on every request.
+            allow_methods=["GET", "POST", "OPTIONS"],
+            allow_headers=["Authorization", "Content-Type"],
         )
         return service_api
 
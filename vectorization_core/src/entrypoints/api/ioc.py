@@ -1,12 +1,10 @@
 import asyncio
-import json
 import traceback
 
-import boto3
 from aws_lambda_powertools import Logger
+from aws_lambda_powertools.utilities import parameters
 from dependency_injector import containers, providers
 from boto3 import client as boto3_client
-from aws_secretsmanager_caching import SecretCache, SecretCacheConfig
 
 from src.adapters.fasttext_vectorizer import FastTextVectorizer
 
@@ -14,12 +12,12 @@ from src.adapters.fasttext_vectorizer import FastTextVectorizer
 logger = Logger(service="VectorizationService")
 
 
-def get_secret(secrets_cache: SecretCache) -> dict:
+def get_secret() -> dict:
     """
     Retrieves secrets from AWS Secrets Manager.
 
-    Args:
-        secrets_cache (SecretCache): AWS Secrets Manager cache instance
+    Uses powertools' parameters utility, which keeps a client-side cache
+    (max_age=600) so warm starts skip the Secrets Manager round trip.
 
     Returns:
         dict: Dictionary containing secret values
@@ -30,9 +28,7 @@ def get_secret(secrets_cache: SecretCache) -> dict:
     secret_name = "dev/ai-custom-bot/vectorization"
     try:
         logger.info(f"Getting secret {secret_name}")
-        secret_value = secrets_cache.get_secret_string(secret_name)
-        logger.info(f"Secret value {secret_value}")
-        return json.loads(secret_value)
+        return parameters.get_secret(secret_name, transform="json", max_age=600)
     except Exception as e:
         logger.info(e)
         logger.info(traceback.format_exc())
@@ -45,17 +41,12 @@ class Container(containers.DeclarativeContainer):
     Dependency Injection container that configures and provides all service dependencies.
     """
 
-    logger.info("Initializing Container")
-    # Configuration and wiring setup
-    wiring_config = containers.WiringConfiguration(modules=[".fastapi_handlers"])
+    # Configuration setup; handlers resolve providers directly, so no wiring.
     config = providers.Configuration()
 
-    logger.info("Initializing Service")
-    # AWS and database client setup
-    secrets_manager_client = boto3.client("secretsmanager", region_name="eu-north-1")
-    cache_config = SecretCacheConfig()
-    secrets_cache = SecretCache(config=cache_config, client=secrets_manager_client)
-    secrets = get_secret(secrets_cache)
+    # Secrets are fetched lazily on first provider resolution so importing
+    # this module never blocks on Secrets Manager.
+    secrets = providers.Singleton(get_secret)
 
     s3_client = providers.Singleton(
         boto3_client, service_name="s3", region_name="eu-north-1"
@@ -64,11 +55,10 @@ class Container(containers.DeclarativeContainer):
     fasttext_vectorizer = providers.Singleton(
         FastTextVectorizer,
         client=s3_client,
-        bucket_name=secrets.get("s3_bucket_name_vectorization_model"),
+        bucket_name=secrets.provided.get.call("s3_bucket_name_vectorization_model"),
         model_s3_key="cc.en.300.bin",
     )
 
-    logger.info("Initialized Container complete")
     _initialized = False
 
     @classmethod
@@ -83,7 +73,7 @@ class Container(containers.DeclarativeContainer):
         logger.info("Initializing application...")
         fasttext_vectorizer_instance = cls.fasttext_vectorizer()
         fasttext_vectorizer_instance.load_model(
-            cls.secrets.get("s3_vectorization_model")
+            cls.secrets().get("s3_vectorization_model")
         )
         logger.info("Application initialized successfully")
         cls._initialized = True